@@ -1,21 +1,40 @@
-"""Benchmark Advanced mode with different max_rounds settings."""
+"""Benchmark Advanced mode with different max_rounds settings.
+
+Runs on uvloop when it is installed (`uv pip install uvloop`) to keep event-loop
+overhead out of the timings; falls back to the stdlib loop otherwise.
+"""
 
 import asyncio
 import time
+from collections import defaultdict
 
 from src.orchestrators.advanced import AdvancedOrchestrator
 
 
+def print_span_breakdown(marks: list[tuple[float, str]], end: float) -> None:
+    """Print time spent after each event type, until the next event arrived."""
+    spans: defaultdict[str, float] = defaultdict(float)
+    for (at, event_type), (next_at, _) in zip(marks, [*marks[1:], (end, "")], strict=True):
+        spans[event_type] += next_at - at
+
+    print("  Span breakdown:")
+    for event_type, seconds in sorted(spans.items(), key=lambda item: -item[1]):
+        print(f"    {event_type:<20} {seconds:8.2f}s")
+
+
 async def benchmark(max_rounds: int) -> float:
     """Run benchmark with specified rounds, return elapsed time."""
     # Pass max_rounds explicitly instead of mutating os.environ
     orch = AdvancedOrchestrator(max_rounds=max_rounds)
-    start = time.time()
+    # perf_counter is monotonic; time.time() can jump with NTP adjustments
+    start = time.perf_counter()
+    marks: list[tuple[float, str]] = [(start, "setup")]
 
     print(f"\nStarting benchmark with max_rounds={max_rounds}...")
 
     try:
         async for event in orch.run("sildenafil erectile dysfunction mechanism"):
+            marks.append((time.perf_counter(), event.type))
             if event.type == "progress":
                 print(f"  Progress: {event.message}")
             elif event.type == "complete":
@@ -27,7 +46,9 @@ async def benchmark(max_rounds: int) -> float:
     except Exception as e:
         print(f"  Exception: {e}")
 
-    return time.time() - start
+    end = time.perf_counter()
+    print_span_breakdown(marks, end)
+    return end - start
 
 
 async def main() -> None:
@@ -39,4 +60,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -3,7 +3,9 @@
 import asyncio
 import json
 import os
-from functools import partial
+import re
+from collections import OrderedDict
+from functools import lru_cache, partial
 from typing import Any, ClassVar
 
 import structlog
@@ -23,10 +25,41 @@ from src.prompts.judge import (
     select_evidence_for_judge,
 )
 from src.utils.config import settings
+from src.utils.executors import HF_EXECUTOR
 from src.utils.models import AssessmentDetails, Evidence, JudgeAssessment
 
 logger = structlog.get_logger()
 
+# Appended to the judge system prompt for HF models, which have no structured output
+_HF_JSON_INSTRUCTIONS = """IMPORTANT: Respond with ONLY valid JSON matching this schema:
+{
+    "details": {
+        "mechanism_score": <int 0-10>,
+        "mechanism_reasoning": "<string>",
+        "clinical_evidence_score": <int 0-10>,
+        "clinical_reasoning": "<string>",
+        "drug_candidates": ["<string>", ...],
+        "key_findings": ["<string>", ...]
+    },
+    "sufficient": <bool>,
+    "confidence": <float 0-1>,
+    "recommendation": "continue" | "synthesize",
+    "next_search_queries": ["<string>", ...],
+    "reasoning": "<string>"
+}"""
+
+
+# 402/quota and 429/rate-limit errors: fail fast instead of trying fallback models
+_HF_LIMIT_ERROR_RE = re.compile(
+    r"402|quota|payment required|429|rate limit|too many requests", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=8)
+def _hf_system_message(domain: ResearchDomain | str | None) -> str:
+    """Build the HF judge system message once per domain instead of per call/retry."""
+    return f"{get_system_prompt(domain)}\n\n{_HF_JSON_INSTRUCTIONS}"
+
 
 def _extract_titles_from_evidence(
     evidence: list[Evidence], max_items: int = 5, fallback_message: str | None = None
@@ -53,6 +86,20 @@ def _extract_titles_from_evidence(
     return findings
 
 
+# Only keys from the server's own configuration go through these caches. BYOK keys
+# are per user and must not outlive their session in a process-wide cache.
+@lru_cache(maxsize=8)
+def _openai_model(model_name: str, api_key: str | None) -> OpenAIChatModel:
+    """Build an OpenAI model once per (model, key) so its client and pool are reused."""
+    return OpenAIChatModel(model_name, provider=OpenAIProvider(api_key=api_key))
+
+
+@lru_cache(maxsize=8)
+def _huggingface_model(model_name: str, api_key: str) -> HuggingFaceModel:
+    """Build a HuggingFace model once per (model, token) so its client is reused."""
+    return HuggingFaceModel(model_name, provider=HuggingFaceProvider(api_key=api_key))
+
+
 def get_model(api_key: str | None = None) -> Any:
     """Get the LLM model based on available API keys.
 
@@ -75,8 +122,7 @@ def get_model(api_key: str | None = None) -> Any:
 
     # Priority 2: OpenAI from env (most common, best tool calling)
     if settings.has_openai_key:
-        openai_provider = OpenAIProvider(api_key=settings.openai_api_key)
-        return OpenAIChatModel(settings.openai_model, provider=openai_provider)
+        return _openai_model(settings.openai_model, settings.openai_api_key)
 
     # Priority 3: HuggingFace (free fallback)
     # Use 7B model to stay on HuggingFace native infrastructure (avoid Novita 500s)
@@ -86,8 +132,7 @@ def get_model(api_key: str | None = None) -> Any:
     # HuggingFaceProvider requires a token - it won't work without one
     hf_token = settings.hf_token or os.environ.get("HF_TOKEN")
     if hf_token:
-        hf_provider = HuggingFaceProvider(api_key=hf_token)
-        return HuggingFaceModel(model_name, provider=hf_provider)
+        return _huggingface_model(model_name, hf_token)
 
     # No HF token available - raise clear error
     raise RuntimeError(
@@ -103,8 +148,13 @@ class JudgeHandler:
     Handles evidence assessment using an LLM with structured output.
 
     Uses PydanticAI to ensure responses match the JudgeAssessment schema.
+    Assessments are cached by prompt, so re-assessing an unchanged evidence
+    set (e.g. an iteration that found nothing new) skips the LLM call.
     """
 
+    # Max cached assessments per handler
+    CACHE_SIZE: ClassVar[int] = 32
+
     def __init__(
         self,
         model: Any = None,
@@ -127,6 +177,7 @@ class JudgeHandler:
             system_prompt=get_system_prompt(domain),
             retries=3,
         )
+        self._assessment_cache: OrderedDict[str, JudgeAssessment] = OrderedDict()
 
     async def assess(
         self,
@@ -173,11 +224,24 @@ class JudgeHandler:
         else:
             user_prompt = format_empty_evidence_prompt(question)
 
+        # The agent's model and system prompt are fixed, so the user prompt is the key
+        cache_key = user_prompt
+        cached = self._assessment_cache.get(cache_key)
+        if cached is not None:
+            self._assessment_cache.move_to_end(cache_key)
+            logger.info("Assessment served from cache", sufficient=cached.sufficient)
+            return cached.model_copy(deep=True)
+
         try:
             # Run the agent with structured output
             result = await self.agent.run(user_prompt)
             assessment = result.output
 
+            # Fallback assessments (below) are never cached, so failures are retried
+            self._assessment_cache[cache_key] = assessment.model_copy(deep=True)
+            if len(self._assessment_cache) > self.CACHE_SIZE:
+                self._assessment_cache.popitem(last=False)
+
             logger.info(
                 "Assessment complete",
                 sufficient=assessment.sufficient,
@@ -340,17 +404,7 @@ class HFInferenceJudgeHandler:
                 # Check for 402/Quota AND 429/Rate-limit errors to fail fast
                 # (CodeRabbit review: added 429 handling)
                 error_str = str(e)
-                if any(
-                    indicator in error_str.lower()
-                    for indicator in [
-                        "402",
-                        "quota",
-                        "payment required",
-                        "429",
-                        "rate limit",
-                        "too many requests",
-                    ]
-                ):
+                if _HF_LIMIT_ERROR_RE.search(error_str):
                     logger.error("HF API limit reached", error=error_str)
                     return self._create_quota_exhausted_assessment(question, evidence)
 
@@ -376,37 +430,16 @@ class HFInferenceJudgeHandler:
     async def _call_with_retry(self, model: str, prompt: str, question: str) -> JudgeAssessment:
         """Make API call with retry logic using chat_completion."""
         loop = asyncio.get_running_loop()
-        system_prompt = get_system_prompt(self.domain)
 
         # Build messages for chat_completion (model-agnostic)
         messages = [
-            {
-                "role": "system",
-                "content": f"""{system_prompt}
-
-IMPORTANT: Respond with ONLY valid JSON matching this schema:
-{{
-    "details": {{
-        "mechanism_score": <int 0-10>,
-        "mechanism_reasoning": "<string>",
-        "clinical_evidence_score": <int 0-10>,
-        "clinical_reasoning": "<string>",
-        "drug_candidates": ["<string>", ...],
-        "key_findings": ["<string>", ...]
-    }},
-    "sufficient": <bool>,
-    "confidence": <float 0-1>,
-    "recommendation": "continue" | "synthesize",
-    "next_search_queries": ["<string>", ...],
-    "reasoning": "<string>"
-}}""",
-            },
+            {"role": "system", "content": _hf_system_message(self.domain)},
             {"role": "user", "content": prompt},
         ]
 
         # Use chat_completion (conversational task - supported by all models)
         response = await loop.run_in_executor(
-            None,
+            HF_EXECUTOR,
             lambda: self.client.chat_completion(
                 messages=messages,
                 model=model,
@@ -420,30 +453,43 @@ IMPORTANT: Respond with ONLY valid JSON matching this schema:
         if not content:
             raise ValueError("Empty response from model")
 
-        # Extract and parse JSON
-        json_data = self._extract_json(content)
-        if not json_data:
+        # Locate the JSON object and let pydantic-core parse and validate it in
+        # one pass, instead of json.loads() into a dict and validating that
+        json_text = self._find_json_object(content)
+        if json_text is None:
             raise ValueError("No valid JSON found in response")
 
-        return JudgeAssessment(**json_data)
+        return JudgeAssessment.model_validate_json(json_text)
 
     def _extract_json(self, text: str) -> dict[str, Any] | None:
         """
         Robust JSON extraction that handles markdown blocks and nested braces.
         """
+        json_text = self._find_json_object(text)
+        if json_text is None:
+            return None
+        try:
+            result = json.loads(json_text)
+        except json.JSONDecodeError:
+            return None
+        return result if isinstance(result, dict) else None
+
+    def _find_json_object(self, text: str) -> str | None:
+        """Return the first brace-balanced {...} span, ignoring markdown fences."""
         text = text.strip()
 
-        # Remove markdown code blocks if present (with bounds checking)
-        if "```json" in text:
-            parts = text.split("```json", 1)
-            if len(parts) > 1:
-                inner_parts = parts[1].split("```", 1)
-                text = inner_parts[0]
-        elif "```" in text:
-            parts = text.split("```", 1)
-            if len(parts) > 1:
-                inner_parts = parts[1].split("```", 1)
-                text = inner_parts[0]
+        # Remove markdown code blocks if present.
+        # str.find locates the fences without building split() part lists.
+        fence_start = text.find("```json")
+        if fence_start != -1:
+            fence_start += len("```json")
+        else:
+            fence_start = text.find("```")
+            if fence_start != -1:
+                fence_start += len("```")
+        if fence_start != -1:
+            fence_end = text.find("```", fence_start)
+            text = text[fence_start:] if fence_end == -1 else text[fence_start:fence_end]
 
         text = text.strip()
 
@@ -472,13 +518,7 @@ IMPORTANT: Respond with ONLY valid JSON matching this schema:
             elif char == "}":
                 count -= 1
                 if count == 0:
-                    try:
-                        result = json.loads(text[start_idx : i + 1])
-                        if isinstance(result, dict):
-                            return result
-                        return None
-                    except json.JSONDecodeError:
-                        return None
+                    return text[start_idx : i + 1]
 
         return None
 
@@ -610,7 +650,7 @@ IMPORTANT: Respond with ONLY valid JSON matching this schema:
             try:
                 logger.info("HF synthesis attempt", model=model)
                 response = await loop.run_in_executor(
-                    None,
+                    HF_EXECUTOR,
                     partial(
                         self.client.chat_completion,
                         messages=messages,
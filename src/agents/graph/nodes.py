@@ -1,17 +1,24 @@
 """Graph node implementations for DeepBoner research."""
 
-from typing import Any, Literal
+from functools import lru_cache
+from typing import Any, Literal, TypeVar, cast
 
 import structlog
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableLambda
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 
 from src.agent_factory.judges import get_model
 from src.agents.graph.state import Hypothesis, ResearchState
+from src.agents.graph.supervisor_cache import (
+    SupervisorCacheKey,
+    SupervisorDecisionCache,
+    llm_cache_identity,
+)
 from src.prompts.hypothesis import SYSTEM_PROMPT as HYPOTHESIS_SYSTEM_PROMPT
 from src.prompts.hypothesis import format_hypothesis_prompt
 from src.prompts.report import SYSTEM_PROMPT as REPORT_SYSTEM_PROMPT
@@ -21,8 +28,10 @@ from src.tools.base import SearchTool
 from src.tools.clinicaltrials import ClinicalTrialsTool
 from src.tools.europepmc import EuropePMCTool
 from src.tools.pubmed import PubMedTool
+from src.tools.search_cache import with_search_cache
 from src.tools.search_handler import SearchHandler
 from src.utils.citation_validator import validate_references
+from src.utils.config import settings
 from src.utils.models import (
     Citation,
     Evidence,
@@ -33,6 +42,29 @@ from src.utils.models import (
 
 logger = structlog.get_logger()
 
+# search_node reuses results of an identical search for this many seconds
+SEARCH_RESULT_CACHE_TTL = 600.0
+
+OutputT = TypeVar("OutputT", bound=BaseModel)
+
+# pydantic-ai Agents reused across node calls, keyed by (output type, system prompt, model)
+_node_agents: dict[tuple[type[BaseModel], str, str], Agent[None, Any]] = {}
+
+
+def _get_node_agent(output_type: type[OutputT], system_prompt: str) -> Agent[None, OutputT]:
+    """Return a shared Agent for this output type, prompt and configured model.
+
+    Building an Agent compiles the output schema and validators, so judge_node
+    and synthesize_node reuse one per model instead of building it every call.
+    """
+    model = get_model()
+    key = (output_type, system_prompt, llm_cache_identity(model))
+    agent = _node_agents.get(key)
+    if agent is None:
+        agent = Agent(model=model, output_type=output_type, system_prompt=system_prompt)
+        _node_agents[key] = agent
+    return cast(Agent[None, OutputT], agent)
+
 
 def _convert_hypothesis_to_mechanism(h: Hypothesis) -> MechanismHypothesis:
     """Convert state Hypothesis to MechanismHypothesis for report generation.
@@ -43,9 +75,15 @@ def _convert_hypothesis_to_mechanism(h: Hypothesis) -> MechanismHypothesis:
     We parse this back into structured MechanismHypothesis fields.
     """
     # Parse statement format: "drug -> target -> pathway -> effect"
-    # Handle both " -> " (standard) and "->" (compact) separators
-    separator = " -> " if " -> " in h.statement else "->"
-    parts = [p.strip() for p in h.statement.split(separator)]
+    # Handle both " -> " (standard) and "->" (compact) separators. Split on the
+    # standard form directly: a single part means it was absent, so no separate
+    # membership scan is needed first.
+    separator = " -> "
+    raw_parts = h.statement.split(separator)
+    if len(raw_parts) == 1:
+        separator = "->"
+        raw_parts = h.statement.split(separator)
+    parts = [p.strip() for p in raw_parts]
 
     # Validate: exactly 4 non-empty parts
     if len(parts) == 4 and all(parts):
@@ -119,6 +157,66 @@ class SupervisorDecision(BaseModel):
     reasoning: str = Field(description="Reasoning for this decision.")
 
 
+# The supervisor parser, format instructions and prompt depend only on
+# SupervisorDecision, so build them once at import instead of per call.
+SUPERVISOR_PARSER = PydanticOutputParser(pydantic_object=SupervisorDecision)
+SUPERVISOR_FORMAT_INSTRUCTIONS = SUPERVISOR_PARSER.get_format_instructions()
+SUPERVISOR_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "You are the Research Supervisor. Manage the workflow.\n\n"
+            "State Summary:\n"
+            "- Query: {query}\n"
+            "- Hypotheses: {hypo_count}\n"
+            "- Conflicts: {conflict_count}\n"
+            "- Iteration: {iteration}/{max_iter}\n\n"
+            "Decide the next step based on this logic:\n"
+            "1. If there are open conflicts -> 'resolve'\n"
+            "2. If hypotheses are unverified or few -> 'search'\n"
+            "3. If new evidence needs evaluation -> 'judge'\n"
+            "4. If hypotheses are confirmed -> 'synthesize'\n\n"
+            "{format_instructions}",
+        ),
+        ("user", "What is the next step?"),
+    ]
+)
+
+
+# Process-wide cache of supervisor decisions keyed by the rendered state summary
+_supervisor_cache: SupervisorDecisionCache[SupervisorDecision] = SupervisorDecisionCache()
+
+
+def clear_node_caches() -> None:
+    """Drop shared node agents and cached supervisor decisions (for testing)."""
+    _node_agents.clear()
+    _supervisor_cache.clear()
+
+
+@lru_cache(maxsize=1)
+def _get_search_tools() -> tuple[SearchTool, ...]:
+    """Return the shared search tools used by search_node.
+
+    Tools are stateless between searches (rate limiters are already shared),
+    so they are built lazily once per process instead of on every iteration.
+    """
+    return (
+        with_search_cache(PubMedTool()),
+        with_search_cache(ClinicalTrialsTool()),
+        with_search_cache(EuropePMCTool()),
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_search_handler() -> SearchHandler:
+    """Return the shared SearchHandler, so its result cache spans search_node calls."""
+    return SearchHandler(
+        tools=list(_get_search_tools()),
+        timeout=settings.search_timeout,
+        cache_ttl=SEARCH_RESULT_CACHE_TTL,
+    )
+
+
 # --- Nodes ---
 
 
@@ -129,12 +227,8 @@ async def search_node(
     query = state["query"]
     logger.info("search_node: executing search", query=query)
 
-    # Initialize tools
-    tools: list[SearchTool] = [PubMedTool(), ClinicalTrialsTool(), EuropePMCTool()]
-    handler = SearchHandler(tools=tools)
-
     # Execute search
-    result = await handler.execute(query)
+    result = await _get_search_handler().execute(query)
 
     new_evidence_count = 0
     new_ids = []
@@ -173,11 +267,7 @@ async def judge_node(
         scored_points = await embedding_service.search_similar(state["query"], n_results=20)
         evidence_context = _results_to_evidence(scored_points)
 
-    agent = Agent(
-        model=get_model(),
-        output_type=HypothesisAssessment,
-        system_prompt=HYPOTHESIS_SYSTEM_PROMPT,
-    )
+    agent = _get_node_agent(HypothesisAssessment, HYPOTHESIS_SYSTEM_PROMPT)
 
     prompt = await format_hypothesis_prompt(
         query=state["query"], evidence=evidence_context, embeddings=embedding_service
@@ -245,11 +335,7 @@ async def synthesize_node(
         scored_points = await embedding_service.search_similar(state["query"], n_results=50)
         evidence_context = _results_to_evidence(scored_points)
 
-    agent = Agent(
-        model=get_model(),
-        output_type=ResearchReport,
-        system_prompt=REPORT_SYSTEM_PROMPT,
-    )
+    agent = _get_node_agent(ResearchReport, REPORT_SYSTEM_PROMPT)
 
     # Convert state hypotheses to MechanismHypothesis for report generation
     mechanism_hypotheses = [_convert_hypothesis_to_mechanism(h) for h in state["hypotheses"]]
@@ -274,51 +360,105 @@ async def synthesize_node(
         return {"messages": [AIMessage(content=f"Synthesis Error: {e!s}")], "next_step": "finish"}
 
 
-async def supervisor_node(state: ResearchState, llm: BaseChatModel | None = None) -> dict[str, Any]:
-    """Route to next node based on state using robust Pydantic parsing."""
+def _require_decision(decision: SupervisorDecision | None) -> SupervisorDecision:
+    """Raise when the model answered in text instead of calling the tool."""
+    if decision is None:
+        raise ValueError("Structured supervisor call returned no decision")
+    return decision
+
+
+def build_supervisor_chain(
+    llm: BaseChatModel,
+) -> Runnable[dict[str, Any], SupervisorDecision]:
+    """Build the supervisor chain, preferring the model's native structured output.
+
+    Models with tool calling emit SupervisorDecision directly, so the prompt
+    carries no JSON schema and there is no text to parse. The prompt | llm |
+    parser chain is used for models without tool calling, and as a fallback if
+    a structured call fails (e.g. the provider rejects the tool definition) or
+    returns no decision because the model replied in plain text.
+    """
+    parser_chain = (
+        SUPERVISOR_PROMPT.partial(format_instructions=SUPERVISOR_FORMAT_INSTRUCTIONS)
+        | llm
+        | SUPERVISOR_PARSER
+    )
+    try:
+        structured_llm = llm.with_structured_output(SupervisorDecision)
+    except NotImplementedError:
+        return parser_chain
+
+    structured_chain = (
+        SUPERVISOR_PROMPT.partial(format_instructions="")
+        | structured_llm
+        | RunnableLambda(_require_decision)
+    )
+    return cast(
+        Runnable[dict[str, Any], SupervisorDecision],
+        structured_chain.with_fallbacks([parser_chain]),
+    )
+
+
+async def supervisor_node(
+    state: ResearchState,
+    llm: BaseChatModel | None = None,
+    chain: Runnable[dict[str, Any], SupervisorDecision] | None = None,
+) -> dict[str, Any]:
+    """Route to next node based on state using robust Pydantic parsing.
+
+    Deterministic states are routed without calling the LLM:
+
+    | State                                      | Next step    |
+    |--------------------------------------------|--------------|
+    | iteration_count >= max_iterations          | "synthesize" |
+    | no LLM configured                          | "search"     |
+    | no evidence, hypotheses or open conflicts  | "search"     |
+
+    Every other state is ambiguous and goes to the LLM through `chain`, which
+    should be built once with build_supervisor_chain() at graph-build time (it
+    is rebuilt per call if omitted).
+    """
     if state["iteration_count"] >= state["max_iterations"]:
         return {"next_step": "synthesize", "iteration_count": state["iteration_count"]}
 
     if llm is None:
         return {"next_step": "search", "iteration_count": state["iteration_count"] + 1}
 
-    parser = PydanticOutputParser(pydantic_object=SupervisorDecision)
-
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                "You are the Research Supervisor. Manage the workflow.\n\n"
-                "State Summary:\n"
-                "- Query: {query}\n"
-                "- Hypotheses: {hypo_count}\n"
-                "- Conflicts: {conflict_count}\n"
-                "- Iteration: {iteration}/{max_iter}\n\n"
-                "Decide the next step based on this logic:\n"
-                "1. If there are open conflicts -> 'resolve'\n"
-                "2. If hypotheses are unverified or few -> 'search'\n"
-                "3. If new evidence needs evaluation -> 'judge'\n"
-                "4. If hypotheses are confirmed -> 'synthesize'\n\n"
-                "{format_instructions}",
-            ),
-            ("user", "What is the next step?"),
-        ]
+    hypo_count = len(state["hypotheses"])
+    # Note: state["conflicts"] contains Pydantic models, so use dot notation
+    conflict_count = len([c for c in state["conflicts"] if c.status == "open"])
+
+    # Nothing to judge, resolve or synthesize yet: searching is the only useful move
+    if not state["evidence_ids"] and hypo_count == 0 and conflict_count == 0:
+        return {"next_step": "search", "iteration_count": state["iteration_count"] + 1}
+    cache_key: SupervisorCacheKey = (
+        llm_cache_identity(llm),
+        state["query"],
+        hypo_count,
+        conflict_count,
+        state["iteration_count"],
+        state["max_iterations"],
     )
 
-    chain = prompt | llm | parser
+    cached = _supervisor_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("supervisor_node: cache hit", next_step=cached.next_step)
+        return {
+            "next_step": cached.next_step,
+            "iteration_count": state["iteration_count"] + 1,
+            "messages": [AIMessage(content=f"Supervisor: {cached.reasoning}")],
+        }
 
     try:
-        # Note: state["conflicts"] contains Pydantic models, so use dot notation
-        decision: SupervisorDecision = await chain.ainvoke(
-            {
-                "query": state["query"],
-                "hypo_count": len(state["hypotheses"]),
-                "conflict_count": len([c for c in state["conflicts"] if c.status == "open"]),
-                "iteration": state["iteration_count"],
-                "max_iter": state["max_iterations"],
-                "format_instructions": parser.get_format_instructions(),
-            }
-        )
+        inputs = {
+            "query": state["query"],
+            "hypo_count": hypo_count,
+            "conflict_count": conflict_count,
+            "iteration": state["iteration_count"],
+            "max_iter": state["max_iterations"],
+        }
+        decision = await (chain or build_supervisor_chain(llm)).ainvoke(inputs)
+        _supervisor_cache.put(cache_key, decision)
         return {
             "next_step": decision.next_step,
             "iteration_count": state["iteration_count"] + 1,
@@ -0,0 +1,64 @@
+"""Decision cache for the LangGraph supervisor node.
+
+The supervisor prompt is rendered entirely from a handful of state counters
+(query, hypothesis count, open conflicts, iteration), so identical summaries
+produce identical prompts. Caching the parsed decision per summary lets
+repeated runs (benchmarks, retries of the same query) skip the LLM round-trip.
+
+Only exact matches are served: a routing decision for a *similar* query is not
+safe to reuse, so no embedding/semantic tier is used here.
+"""
+
+from collections import OrderedDict
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+# (model identity, query, hypo_count, conflict_count, iteration, max_iter)
+SupervisorCacheKey = tuple[str, str, int, int, int, int]
+
+
+def llm_cache_identity(llm: Any) -> str:
+    """Return a stable identity for an LLM so decisions are not shared across models."""
+    for attr in ("model_name", "model", "model_id", "repo_id"):
+        value = getattr(llm, attr, None)
+        if isinstance(value, str) and value:
+            return f"{type(llm).__name__}:{value}"
+    # Fall back to the instance itself (same object -> same model)
+    return f"{type(llm).__name__}@{id(llm):x}"
+
+
+class SupervisorDecisionCache(Generic[T]):
+    """Bounded LRU cache of supervisor decisions keyed by state summary."""
+
+    def __init__(self, max_size: int = 256) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[SupervisorCacheKey, T] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: SupervisorCacheKey) -> T | None:
+        """Return the cached decision for key, or None on a miss."""
+        decision = self._entries.get(key)
+        if decision is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return decision
+
+    def put(self, key: SupervisorCacheKey, decision: T) -> None:
+        """Store a decision, evicting the least recently used entry when full."""
+        self._entries[key] = decision
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached decisions (for testing)."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -11,6 +11,7 @@ from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
 from src.agents.graph.nodes import (
+    build_supervisor_chain,
     judge_node,
     resolve_node,
     search_node,
@@ -36,8 +37,13 @@ def create_research_graph(
     graph = StateGraph(ResearchState)
 
     # --- Nodes ---
-    # Bind the LLM to the supervisor node using partial
-    bound_supervisor = partial(supervisor_node, llm=llm) if llm else supervisor_node
+    # Bind the LLM and its supervisor chain (prompt partials applied once, here)
+    # to the supervisor node
+    bound_supervisor = (
+        partial(supervisor_node, llm=llm, chain=build_supervisor_chain(llm))
+        if llm
+        else supervisor_node
+    )
 
     # Bind embedding service to worker nodes
     # We use partial to inject the service dependency while keeping the node signature clean
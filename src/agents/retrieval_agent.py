@@ -41,11 +41,12 @@ async def search_web(query: str, max_results: int = 10) -> str:
         new_evidence=new_count,
     )
 
+    # One string per result (rather than one per line) keeps the join list short
     output = [f"Found {len(results.evidence)} web results ({new_count} new stored):\n"]
-    for i, r in enumerate(results.evidence[:max_results], 1):
-        output.append(f"{i}. **{r.citation.title}**")
-        output.append(f"   Source: {r.citation.url}")
-        output.append(f"   {r.content[:300]}...\n")
+    output.extend(
+        f"{i}. **{r.citation.title}**\n   Source: {r.citation.url}\n   {r.content[:300]}...\n"
+        for i, r in enumerate(results.evidence[:max_results], 1)
+    )
 
     return "\n".join(output)
 
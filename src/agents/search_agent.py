@@ -36,6 +36,33 @@ class SearchAgent(BaseAgent):  # type: ignore[misc]
         self._handler = search_handler
         self._evidence_store = evidence_store
         self._embeddings = embedding_service
+        # URLs of evidence_store["current"], extended as the store grows instead of
+        # being rebuilt from the whole store on every run
+        self._known_urls: set[str] = set()
+        self._known_count = 0
+
+    def _sync_known_urls(self) -> set[str]:
+        """Bring the URL set up to date with evidence_store["current"]."""
+        current = self._evidence_store["current"]
+        if len(current) < self._known_count:
+            # Store was replaced or truncated elsewhere; rebuild from scratch
+            self._known_urls = {e.citation.url for e in current}
+        else:
+            self._known_urls.update(e.citation.url for e in current[self._known_count :])
+        self._known_count = len(current)
+        return self._known_urls
+
+    def _add_to_store(self, evidence: list[Evidence]) -> int:
+        """Append evidence with URLs not already in the store; return how many were added."""
+        known_urls = self._sync_known_urls()
+        added = 0
+        for e in evidence:
+            if e.citation.url not in known_urls:
+                known_urls.add(e.citation.url)
+                self._evidence_store["current"].append(e)
+                added += 1
+        self._known_count += added
+        return added
 
     async def run(
         self,
@@ -111,19 +138,12 @@ class SearchAgent(BaseAgent):  # type: ignore[misc]
             final_new_evidence = unique_evidence + related_evidence
 
             # Add to global store (deduping against global store)
-            global_urls = {e.citation.url for e in self._evidence_store["current"]}
-            really_new = [e for e in final_new_evidence if e.citation.url not in global_urls]
-            self._evidence_store["current"].extend(really_new)
-
-            total_new = len(really_new)
+            total_new = self._add_to_store(final_new_evidence)
             evidence_to_show = unique_evidence + related_evidence
 
         else:
             # Fallback to URL-based deduplication (no embeddings)
-            existing_urls = {e.citation.url for e in self._evidence_store["current"]}
-            new_unique = [e for e in result.evidence if e.citation.url not in existing_urls]
-            self._evidence_store["current"].extend(new_unique)
-            total_new = len(new_unique)
+            total_new = self._add_to_store(result.evidence)
             evidence_to_show = result.evidence
 
         evidence_text = "\n".join(
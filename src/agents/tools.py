@@ -10,11 +10,12 @@ from src.agents.state import get_magentic_state
 from src.tools.clinicaltrials import ClinicalTrialsTool
 from src.tools.europepmc import EuropePMCTool
 from src.tools.pubmed import PubMedTool
+from src.tools.search_cache import with_search_cache
 
-# Singleton tool instances (stateless wrappers)
-_pubmed = PubMedTool()
-_clinicaltrials = ClinicalTrialsTool()
-_europepmc = EuropePMCTool()
+# Singleton tool instances (stateless wrappers, cached if SEARCH_CACHE_DIR is set)
+_pubmed = with_search_cache(PubMedTool())
+_clinicaltrials = with_search_cache(ClinicalTrialsTool())
+_europepmc = with_search_cache(EuropePMCTool())
 
 
 @ai_function  # type: ignore[arg-type, misc, untyped-decorator]
@@ -9,7 +9,7 @@ import structlog
 
 from src.config.domain import ResearchDomain
 from src.orchestrators import create_orchestrator
-from src.utils.config import settings
+from src.utils.config import configure_logging, settings
 from src.utils.exceptions import ConfigurationError
 from src.utils.models import OrchestratorConfig
 from src.utils.service_loader import warmup_services
@@ -321,6 +321,7 @@ def create_demo() -> tuple[gr.ChatInterface, gr.Accordion]:
 
 def main() -> None:
     """Run the Gradio app with MCP server enabled."""
+    configure_logging(settings)
     warmup_services()  # Phase 2: Pre-warm services
     demo, _ = create_demo()
     demo.launch(
@@ -29,6 +29,7 @@ from huggingface_hub import InferenceClient
 
 from src.middleware import RetryMiddleware, TokenTrackingMiddleware
 from src.utils.config import settings
+from src.utils.executors import HF_EXECUTOR
 
 logger = structlog.get_logger()
 
@@ -229,7 +230,7 @@ class HuggingFaceChatClient(BaseChatClient):  # type: ignore[misc]
             max_tokens = chat_options.max_tokens if chat_options.max_tokens is not None else 2048
             temperature = chat_options.temperature if chat_options.temperature is not None else 0.7
 
-            # Use partial to create a callable with keyword args for to_thread
+            # Use partial to create a callable with keyword args for the executor
             call_fn = partial(
                 self._client.chat_completion,
                 messages=hf_messages,
@@ -240,7 +241,8 @@ class HuggingFaceChatClient(BaseChatClient):  # type: ignore[misc]
                 stream=False,
             )
 
-            response = await asyncio.to_thread(call_fn)
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(HF_EXECUTOR, call_fn)
 
             # Parse response
             # HF returns a ChatCompletionOutput
@@ -306,13 +308,19 @@ class HuggingFaceChatClient(BaseChatClient):  # type: ignore[misc]
                 stream=True,
             )
 
-            stream = await asyncio.to_thread(call_fn)
+            loop = asyncio.get_running_loop()
+            stream = await loop.run_in_executor(HF_EXECUTOR, call_fn)
 
             # Accumulator for tool calls (index -> dict)
             # We need to accumulate because deltas are partial
             tool_call_accumulator: dict[int, dict[str, Any]] = {}
 
-            for chunk in stream:
+            # Each next() on the sync stream blocks on a network read, so pull
+            # chunks in a worker thread instead of iterating on the event loop.
+            chunk_iter = iter(stream)
+            while (
+                chunk := await loop.run_in_executor(HF_EXECUTOR, next, chunk_iter, None)
+            ) is not None:
                 # Chunk is ChatCompletionStreamOutput
                 if not chunk.choices:
                     continue
@@ -346,9 +354,6 @@ class HuggingFaceChatClient(BaseChatClient):  # type: ignore[misc]
                             if tc.function.arguments:
                                 tool_call_accumulator[idx]["arguments"] += tc.function.arguments
 
-                # Yield control to event loop
-                await asyncio.sleep(0)
-
             # 3. Yield Accumulated Tool Calls
             if tool_call_accumulator:
                 contents: list[FunctionCallContent] = []
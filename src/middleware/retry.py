@@ -3,12 +3,32 @@
 import asyncio
 import random
 from collections.abc import Awaitable, Callable
+from functools import lru_cache
 
 import structlog
 from agent_framework._middleware import ChatContext, ChatMiddleware
 
 logger = structlog.get_logger()
 
+# Transient network errors, matched by class before falling back to the name check
+_RETRYABLE_ERRORS: tuple[type[BaseException], ...] = (TimeoutError, ConnectionError)
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=128)
+def _is_transient_error_type(error_type: type[BaseException]) -> bool:
+    """Classify an exception type as a timeout/connection error, once per type.
+
+    Provider SDKs define their own hierarchies (e.g. APITimeoutError,
+    APIConnectionError) that don't subclass the builtins, so the name check
+    is still needed; caching it keeps it off the per-failure path.
+    """
+    if issubclass(error_type, _RETRYABLE_ERRORS):
+        return True
+    error_name = error_type.__name__.lower()
+    return "timeout" in error_name or "connection" in error_name
+
 
 class RetryMiddleware(ChatMiddleware):
     """Retries failed chat requests with exponential backoff.
@@ -34,28 +54,25 @@ class RetryMiddleware(ChatMiddleware):
         self.min_wait = min_wait
         self.max_wait = max_wait
         self.retryable_status_codes = retryable_status_codes
+        self._retryable_status_set = frozenset(retryable_status_codes)
+        # Base (pre-jitter) wait before each retry: min_wait * 2^attempt, capped
+        self._wait_schedule = tuple(
+            min(min_wait * (2**attempt), max_wait) for attempt in range(max_attempts)
+        )
 
     def _is_retryable(self, error: Exception) -> bool:
         """Check if error is retryable."""
         # Check for httpx status errors
-        if hasattr(error, "response") and hasattr(error.response, "status_code"):
-            return error.response.status_code in self.retryable_status_codes
-
-        # Check for timeout errors
-        error_name = type(error).__name__.lower()
-        if "timeout" in error_name:
-            return True
-
-        # Check for connection errors
-        if "connection" in error_name:
-            return True
+        status_code = getattr(getattr(error, "response", None), "status_code", _MISSING)
+        if status_code is not _MISSING:
+            return status_code in self._retryable_status_set
 
-        return False
+        # Check for timeout and connection errors
+        return _is_transient_error_type(type(error))
 
     def _calculate_wait(self, attempt: int) -> float:
         """Calculate wait time with exponential backoff and jitter."""
-        wait = self.min_wait * (2**attempt)
-        wait = min(wait, self.max_wait)
+        wait = self._wait_schedule[attempt]
         # Add jitter (±25%) to avoid thundering herd
         jitter = wait * 0.25 * (2 * random.random() - 1)
         return float(max(self.min_wait, wait + jitter))
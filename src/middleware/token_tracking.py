@@ -1,6 +1,7 @@
 """Token tracking middleware for monitoring API usage."""
 
 from collections.abc import Awaitable, Callable
+from typing import ClassVar
 
 import structlog
 from agent_framework._middleware import ChatContext, ChatMiddleware
@@ -11,12 +12,16 @@ logger = structlog.get_logger()
 class TokenTrackingMiddleware(ChatMiddleware):
     """Tracks token usage across chat requests.
 
-    This middleware logs token usage after each chat completion
-    and maintains running totals for the session.
+    This middleware maintains running totals for the session. Per-request
+    usage is logged at DEBUG; the running totals are logged at INFO every
+    SUMMARY_INTERVAL requests rather than on every chat completion.
 
     Usage metrics are logged via structlog for observability.
     """
 
+    # Requests between INFO-level running-total log lines
+    SUMMARY_INTERVAL: ClassVar[int] = 10
+
     def __init__(self) -> None:
         self.total_input_tokens = 0
         self.total_output_tokens = 0
@@ -29,19 +34,18 @@ class TokenTrackingMiddleware(ChatMiddleware):
         await next(context)
 
         # Extract usage from response if available
-        if context.result is None:
+        result = context.result
+        if result is None:
             return
 
-        usage = None
-
-        # Try to get usage from response
-        if hasattr(context.result, "usage"):
-            usage = context.result.usage
-        elif hasattr(context.result, "messages") and context.result.messages:
-            # Check first message for usage metadata
-            msg = context.result.messages[0]
-            if hasattr(msg, "metadata") and msg.metadata:
-                usage = msg.metadata.get("usage")
+        # Try to get usage from response, then from first message metadata
+        usage = getattr(result, "usage", None)
+        if usage is None:
+            messages = getattr(result, "messages", None)
+            if messages:
+                metadata = getattr(messages[0], "metadata", None)
+                if metadata:
+                    usage = metadata.get("usage")
 
         if usage:
             # Handle both dict-like and object attribute access
@@ -62,14 +66,18 @@ class TokenTrackingMiddleware(ChatMiddleware):
             self.total_output_tokens += output_tokens
             self.request_count += 1
 
-            logger.info(
+            logger.debug(
                 "Token usage",
                 request_input=input_tokens,
                 request_output=output_tokens,
-                total_input=self.total_input_tokens,
-                total_output=self.total_output_tokens,
-                total_requests=self.request_count,
             )
+            if self.request_count % self.SUMMARY_INTERVAL == 0:
+                logger.info(
+                    "Token usage totals",
+                    total_input=self.total_input_tokens,
+                    total_output=self.total_output_tokens,
+                    total_requests=self.request_count,
+                )
 
     def get_stats(self) -> dict[str, int]:
         """Get cumulative token usage statistics.
@@ -65,7 +65,9 @@ class WorkflowState:
 
     iteration: int = 0
     reporter_ran: bool = False
-    current_message_buffer: str = ""
+    # Only the length of the streamed message is needed, so count characters
+    # instead of concatenating the text (quadratic for long streamed reports)
+    current_message_length: int = 0
     current_agent_id: str | None = None
     last_streamed_length: int = 0
     final_event_received: bool = False
@@ -289,11 +291,21 @@ The final output should be a structured research report."""
         """
         logger.info("Starting Advanced orchestrator", query=query)
 
-        async for event in self._init_workflow_events(query):
-            yield event
+        # Start loading the embedding service (model load, ChromaDB) in a worker
+        # thread right away so it overlaps with event delivery instead of
+        # blocking the event loop.
+        embedding_task = asyncio.create_task(asyncio.to_thread(self._init_embedding_service))
 
-        # Initialize context state
-        embedding_service = self._init_embedding_service()
+        try:
+            async for event in self._init_workflow_events(query):
+                yield event
+
+            # Initialize context state
+            embedding_service = await embedding_task
+        finally:
+            # No-op once awaited; if the consumer closed the generator early, don't
+            # leave the task pending (the worker thread itself runs to completion)
+            embedding_task.cancel()
 
         yield AgentEvent(
             type="progress",
@@ -340,14 +352,14 @@ The final output should be a structured research report."""
                                 continue  # Skip internal coordination messages
 
                         author = getattr(event.data, "author_name", None)
-                        # Detect agent switch to clear buffer
+                        # Detect agent switch to reset the streamed length
                         if author != state.current_agent_id:
-                            state.current_message_buffer = ""
+                            state.current_message_length = 0
                             state.current_agent_id = author
 
                         text = getattr(event.data, "text", None)
                         if text:
-                            state.current_message_buffer += text
+                            state.current_message_length += len(text)
                             yield AgentEvent(
                                 type="streaming",
                                 message=text,
@@ -365,9 +377,9 @@ The final output should be a structured research report."""
                             state.reporter_ran = True
 
                         # P2 BUG FIX: Save length before clearing
-                        state.last_streamed_length = len(state.current_message_buffer)
-                        # Clear buffer after consuming
-                        state.current_message_buffer = ""
+                        state.last_streamed_length = state.current_message_length
+                        # Reset after consuming
+                        state.current_message_length = 0
                         continue
 
                     # 3. Handle Final Events Inline (P2 Duplicate Report Fix + P1 Forced Synthesis)
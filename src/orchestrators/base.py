@@ -90,7 +90,6 @@ class SynthesizableJudge(Protocol):
         ...
 
 
-@runtime_checkable
 class OrchestratorProtocol(Protocol):
     """Protocol for orchestrators.
 
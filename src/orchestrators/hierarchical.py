@@ -132,6 +132,11 @@ class HierarchicalOrchestrator(OrchestratorProtocol):
                         event = get_event.result()
                         if event:
                             yield event
+                        # Drain events queued meanwhile without a get() task per event
+                        while not queue.empty():
+                            ev = queue.get_nowait()
+                            if ev:
+                                yield ev
                     else:
                         get_event.cancel()
 
@@ -5,6 +5,7 @@ The sentence-transformers model is CPU-bound, so we use run_in_executor().
 """
 
 import asyncio
+import threading
 import uuid
 from typing import Any
 
@@ -16,14 +17,32 @@ from src.utils.config import settings
 from src.utils.models import Evidence
 
 _shared_model: SentenceTransformer | None = None
+# warmup_services() loads the model in a background thread; the lock stops the first
+# request from loading a second copy while that is still in progress
+_shared_model_lock = threading.Lock()
+
+_HALF_PRECISION_DEVICES = frozenset({"cuda", "mps"})
 
 
 def _get_shared_model(model_name: str) -> SentenceTransformer:
     """Get or create shared SentenceTransformer model instance."""
     global _shared_model  # noqa: PLW0603
-    if _shared_model is None:
-        _shared_model = SentenceTransformer(model_name)
-    return _shared_model
+    if _shared_model is not None:
+        return _shared_model
+
+    with _shared_model_lock:
+        if _shared_model is None:
+            backend = settings.local_embedding_backend
+            if backend == "torch":
+                model = SentenceTransformer(model_name)
+                # Half precision halves memory traffic on accelerators; CPU fp16 is slower
+                if model.device.type in _HALF_PRECISION_DEVICES:
+                    model.half()
+            else:
+                # Exported graph with fused kernels (requires sentence-transformers[onnx|openvino])
+                model = SentenceTransformer(model_name, backend=backend)
+            _shared_model = model
+        return _shared_model
 
 
 class EmbeddingService:
@@ -57,8 +76,9 @@ class EmbeddingService:
 
     def _sync_batch_embed(self, texts: list[str]) -> list[list[float]]:
         """Batch embedding for efficiency - DO NOT call directly from async code."""
-        embeddings = self._model.encode(texts)
-        return [e.tolist() for e in embeddings]
+        # One tolist() on the 2-D array converts every row without per-row temporaries
+        result: list[list[float]] = self._model.encode(texts).tolist()
+        return result
 
     # ─────────────────────────────────────────────────────────────────
     # Async public methods (safe for event loop)
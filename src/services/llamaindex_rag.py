@@ -58,6 +58,7 @@ class LlamaIndexRAGService:
         try:
             import chromadb
             from llama_index.core import Document, Settings, StorageContext, VectorStoreIndex
+            from llama_index.core.ingestion import run_transformations
             from llama_index.core.retrievers import VectorIndexRetriever
             from llama_index.embeddings.openai import OpenAIEmbedding
             from llama_index.llms.openai import OpenAI
@@ -74,6 +75,7 @@ class LlamaIndexRAGService:
         self._StorageContext = StorageContext
         self._VectorStoreIndex = VectorStoreIndex
         self._VectorIndexRetriever = VectorIndexRetriever
+        self._run_transformations = run_transformations
         self._ChromaVectorStore = ChromaVectorStore
 
         self.collection_name = collection_name
@@ -146,6 +148,27 @@ class LlamaIndexRAGService:
             self.index = self._VectorStoreIndex([], storage_context=self.storage_context)
             logger.info("created_new_index")
 
+    def _insert_documents(self, documents: list[Any]) -> None:
+        """Insert documents with one batched embedding pass.
+
+        Equivalent to index.insert() per document, but all nodes go through a single
+        insert_nodes() call so the embed model sees them in batches of
+        embed_batch_size instead of one request per document.
+        """
+        nodes = self._run_transformations(documents, self._Settings.transformations)
+        self.index.insert_nodes(nodes)
+        for doc in documents:
+            self.index.docstore.set_document_hash(doc.get_doc_id(), doc.hash)
+
+    def _existing_doc_ids(self, doc_ids: list[str]) -> set[str]:
+        """Return which document IDs already have nodes in the collection."""
+        # LlamaIndex stores each node's source document ID in its metadata
+        found = self.collection.get(
+            where={"ref_doc_id": {"$in": doc_ids}},
+            include=["metadatas"],
+        )
+        return {str(meta["ref_doc_id"]) for meta in found.get("metadatas") or []}
+
     def ingest_evidence(self, evidence_list: list[Evidence]) -> None:
         """
         Ingest evidence into the vector store.
@@ -177,9 +200,13 @@ class LlamaIndexRAGService:
 
         # Insert documents into index
         try:
-            for doc in documents:
-                self.index.insert(doc)
-            logger.info("ingested_evidence", count=len(documents))
+            # Skip evidence already in the (persistent) collection: re-inserting it
+            # would pay for embeddings again and add duplicate nodes
+            existing = self._existing_doc_ids([doc.get_doc_id() for doc in documents])
+            documents = [doc for doc in documents if doc.get_doc_id() not in existing]
+            if documents:
+                self._insert_documents(documents)
+            logger.info("ingested_evidence", count=len(documents), skipped=len(existing))
         except (ValueError, RuntimeError) as e:
             logger.error("failed_to_ingest_evidence", error=str(e))
             raise EmbeddingError(f"Failed to ingest evidence: {e}") from e
@@ -196,8 +223,7 @@ class LlamaIndexRAGService:
             return
 
         try:
-            for doc in documents:
-                self.index.insert(doc)
+            self._insert_documents(documents)
             logger.info("ingested_documents", count=len(documents))
         except (ValueError, RuntimeError) as e:
             logger.error("failed_to_ingest_documents", error=str(e))
@@ -303,10 +329,10 @@ class LlamaIndexRAGService:
         """
         loop = asyncio.get_running_loop()
         # LlamaIndex embed_model has get_text_embedding method
-        embedding = await loop.run_in_executor(
+        embedding: list[float] = await loop.run_in_executor(
             None, self._Settings.embed_model.get_text_embedding, text
         )
-        return list(embedding)
+        return embedding
 
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """Embed multiple texts efficiently (Protocol-compatible).
@@ -324,10 +350,10 @@ class LlamaIndexRAGService:
 
         loop = asyncio.get_running_loop()
         # LlamaIndex embed_model has get_text_embedding_batch method
-        embeddings = await loop.run_in_executor(
+        embeddings: list[list[float]] = await loop.run_in_executor(
             None, self._Settings.embed_model.get_text_embedding_batch, texts
         )
-        return [list(emb) for emb in embeddings]
+        return embeddings
 
     async def add_evidence(self, evidence_id: str, content: str, metadata: dict[str, Any]) -> None:
         """Async wrapper for adding evidence (Protocol-compatible).
@@ -140,9 +140,10 @@ class ResearchMemory:
         summary.append(f"## Evidence ({len(evidence)} items)")
 
         # Group by source for cleaner summary
-        for i, ev in enumerate(evidence[:20], 1):  # Limit to top 20 items
-            summary.append(f"{i}. {ev.citation.title} ({ev.citation.date})")
-            summary.append(f"   {ev.content[:200]}...")  # Brief snippet
+        summary.extend(
+            f"{i}. {ev.citation.title} ({ev.citation.date})\n   {ev.content[:200]}..."
+            for i, ev in enumerate(evidence[:20], 1)  # Limit to top 20 items
+        )
 
         return "\n".join(summary)
 
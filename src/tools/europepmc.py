@@ -5,6 +5,7 @@ from typing import Any
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from src.tools.http_pool import get_shared_transport
 from src.utils.exceptions import SearchError
 from src.utils.models import Citation, Evidence
 
@@ -51,7 +52,7 @@ class EuropePMCTool:
             "format": "json",
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with httpx.AsyncClient(timeout=30.0, transport=get_shared_transport()) as client:
             try:
                 response = await client.get(self.BASE_URL, params=params)
                 response.raise_for_status()
@@ -0,0 +1,43 @@
+"""Shared HTTP connection pool for search tools.
+
+Each search opens a short-lived httpx.AsyncClient. On its own that means a
+fresh TCP + TLS handshake for every search, retry and PubMed ESearch/EFetch
+pair. Tools pass the shared transport from get_shared_transport() instead, so
+keep-alive connections to each API are reused across calls while the
+per-call ``async with httpx.AsyncClient(...)`` structure stays unchanged.
+"""
+
+import asyncio
+import weakref
+
+import httpx
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Pooled transport that outlives the clients using it."""
+
+    def __init__(self) -> None:
+        self._transport = httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # Called when each borrowing client exits; the pool stays open for the next one
+        pass
+
+
+# Connections are bound to the event loop that opened them, so pool per loop
+_transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedTransport]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_transport() -> httpx.AsyncBaseTransport:
+    """Get the connection-pooling transport for the running event loop."""
+    loop = asyncio.get_running_loop()
+    transport = _transports.get(loop)
+    if transport is None:
+        transport = _SharedTransport()
+        _transports[loop] = transport
+    return transport
@@ -1,14 +1,19 @@
 """OpenAlex search tool - citation-aware scholarly search."""
 
+import heapq
 import re
 from typing import Any
 
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from src.tools.http_pool import get_shared_transport
 from src.utils.exceptions import SearchError
 from src.utils.models import Citation, Evidence
 
+# Trailing numeric PMID in an OpenAlex ids.pmid URL
+_PMID_SUFFIX_RE = re.compile(r"/(\d+)/?$")
+
 
 class OpenAlexTool:
     """
@@ -55,7 +60,7 @@ class OpenAlexTool:
             "mailto": self.POLITE_EMAIL,
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with httpx.AsyncClient(timeout=30.0, transport=get_shared_transport()) as client:
             try:
                 response = await client.get(self.BASE_URL, params=params)
                 response.raise_for_status()
@@ -111,7 +116,7 @@ class OpenAlexTool:
         pmid = None
         if pmid_url and isinstance(pmid_url, str) and "pubmed.ncbi.nlm.nih.gov" in pmid_url:
             # Extract numeric PMID from URL
-            pmid_match = re.search(r"/(\d+)/?$", pmid_url)
+            pmid_match = _PMID_SUFFIX_RE.search(pmid_url)
             if pmid_match:
                 pmid = pmid_match.group(1)
 
@@ -170,5 +175,5 @@ class OpenAlexTool:
 
     def _extract_concepts(self, concepts: list[dict[str, Any]]) -> list[str]:
         """Extract concept names, sorted by score."""
-        sorted_concepts = sorted(concepts, key=lambda c: c.get("score", 0), reverse=True)
-        return [c.get("display_name", "") for c in sorted_concepts[:5] if c.get("display_name")]
+        top_concepts = heapq.nlargest(5, concepts, key=lambda c: c.get("score", 0))
+        return [c.get("display_name", "") for c in top_concepts if c.get("display_name")]
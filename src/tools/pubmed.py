@@ -8,6 +8,7 @@ import structlog
 import xmltodict
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from src.tools.http_pool import get_shared_transport
 from src.tools.query_utils import preprocess_query
 from src.tools.rate_limiter import get_pubmed_limiter
 from src.utils.config import settings
@@ -66,7 +67,7 @@ class PubMedTool:
         clean_query = preprocess_query(query)
         final_query = clean_query if clean_query else query
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with httpx.AsyncClient(timeout=30.0, transport=get_shared_transport()) as client:
             # Step 1: Search for PMIDs
             search_params = self._build_params(
                 db="pubmed",
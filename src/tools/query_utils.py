@@ -2,6 +2,8 @@
 
 import re
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
 # Question words and filler words to remove
 QUESTION_WORDS: set[str] = {
     # Question starters
@@ -81,6 +83,18 @@ SYNONYMS: dict[str, list[str]] = {
     ],
 }
 
+# Precomputed OR groups: ("term1" OR "term2" OR "term3")
+_SYNONYM_GROUPS: dict[str, str] = {
+    term: "(" + " OR ".join(f'"{exp}"' for exp in expansions) + ")"
+    for term, expansions in SYNONYMS.items()
+}
+# Single alternation over all terms (no term is a prefix of another)
+_SYNONYM_RE = re.compile("|".join(re.escape(term) for term in SYNONYMS))
+
+
+def _expand_synonym_match(match: re.Match[str]) -> str:
+    return _SYNONYM_GROUPS[match.group(0)]
+
 
 def strip_question_words(query: str) -> str:
     """
@@ -107,20 +121,9 @@ def expand_synonyms(query: str) -> str:
     Returns:
         Query with synonym expansions in OR groups
     """
-    result = query.lower()
-
-    for term, expansions in SYNONYMS.items():
-        if term in result:
-            # Create OR group: ("term1" OR "term2" OR "term3")
-            or_group = " OR ".join([f'"{exp}"' for exp in expansions])
-            # Case insensitive replacement is tricky with simple replace
-            # But we lowercased result already.
-            # However, this replaces ALL instances.
-            # Also, result is lowercased, so we lose original casing if any.
-            # But search engines are usually case-insensitive.
-            result = result.replace(term, f"({or_group})")
-
-    return result
+    # Lowercased so terms match case-insensitively; search engines ignore case anyway.
+    # One scan replaces every occurrence of every term.
+    return _SYNONYM_RE.sub(_expand_synonym_match, query.lower())
 
 
 def preprocess_query(raw_query: str) -> str:
@@ -143,7 +146,7 @@ def preprocess_query(raw_query: str) -> str:
 
     # Remove question marks and extra whitespace
     query = raw_query.replace("?", "").strip()
-    query = re.sub(r"\s+", " ", query)
+    query = _WHITESPACE_RE.sub(" ", query)
 
     # Strip question words
     query = strip_question_words(query)
@@ -0,0 +1,140 @@
+"""Persistent disk cache for search tool results.
+
+Benchmarks and demos repeat the same queries run after run, paying a full
+round-trip to PubMed/ClinicalTrials.gov/Europe PMC each time. When
+SEARCH_CACHE_DIR is set, search tools are wrapped in CachedSearchTool and
+results are served from disk until they expire.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import structlog
+from pydantic import BaseModel
+
+from src.tools.base import SearchTool
+from src.utils.config import settings
+from src.utils.models import Citation, Evidence
+
+logger = structlog.get_logger()
+
+# Bump to invalidate all cached entries (e.g. after changing Evidence parsing or
+# the Evidence/Citation schema - entries are rehydrated without validation)
+SEARCH_CACHE_VERSION = 1
+
+
+class _CacheEntry(BaseModel):
+    """On-disk entry; serialized by pydantic-core without intermediate dicts."""
+
+    created_at: float
+    evidence: list[Evidence]
+
+
+def _evidence_from_cache(item: dict[str, Any]) -> Evidence:
+    """Rebuild Evidence we serialized ourselves, skipping pydantic validation."""
+    return Evidence.model_construct(
+        content=item["content"],
+        citation=Citation.model_construct(**item["citation"]),
+        relevance=item["relevance"],
+        metadata=item["metadata"],
+    )
+
+
+class SearchResultCache:
+    """File-per-entry JSON cache of search results with a TTL."""
+
+    def __init__(self, cache_dir: str | Path, ttl_seconds: float = 86400.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cache entries in (created if missing)
+            ttl_seconds: Entries older than this are treated as misses
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, tool_name: str, query: str, max_results: int) -> Path:
+        key = f"{SEARCH_CACHE_VERSION}\0{tool_name}\0{query}\0{max_results}"
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{tool_name}-{digest}.json"
+
+    def get(self, tool_name: str, query: str, max_results: int) -> list[Evidence] | None:
+        """Return cached evidence, or None if missing, expired or unreadable."""
+        path = self._path(tool_name, query, max_results)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            if time.time() - entry["created_at"] > self.ttl_seconds:
+                return None
+            return [_evidence_from_cache(item) for item in entry["evidence"]]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable search cache entry", path=str(path), error=str(e))
+            return None
+
+    def set(self, tool_name: str, query: str, max_results: int, evidence: list[Evidence]) -> None:
+        """Store evidence for a query (atomic replace, last writer wins)."""
+        path = self._path(tool_name, query, max_results)
+        # Evidence is already validated; construct() skips re-validating it
+        entry = _CacheEntry.model_construct(created_at=time.time(), evidence=evidence)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(entry.model_dump_json(), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Failed to write search cache entry", path=str(path), error=str(e))
+
+
+class CachedSearchTool:
+    """SearchTool wrapper that serves repeated queries from a SearchResultCache."""
+
+    def __init__(self, tool: SearchTool, cache: SearchResultCache) -> None:
+        self._tool = tool
+        self._cache = cache
+
+    @property
+    def name(self) -> str:
+        return self._tool.name
+
+    async def search(self, query: str, max_results: int = 10) -> list[Evidence]:
+        """Return cached results if fresh, otherwise search and cache the results."""
+        cached = await asyncio.to_thread(self._cache.get, self.name, query, max_results)
+        if cached is not None:
+            logger.debug("Search cache hit", tool=self.name, query=query)
+            return cached
+
+        results = await self._tool.search(query, max_results)
+        # Empty results are not cached: some tools return [] on transient upstream
+        # problems (e.g. PubMed maintenance pages) rather than raising.
+        if results:
+            await asyncio.to_thread(self._cache.set, self.name, query, max_results, results)
+        return results
+
+
+_search_cache: SearchResultCache | None = None
+
+
+def get_search_cache() -> SearchResultCache | None:
+    """Get the shared search cache, or None if SEARCH_CACHE_DIR is not configured."""
+    global _search_cache
+
+    if settings.search_cache_dir is None:
+        return None
+    if _search_cache is None:
+        _search_cache = SearchResultCache(
+            settings.search_cache_dir, ttl_seconds=settings.search_cache_ttl
+        )
+    return _search_cache
+
+
+def with_search_cache(tool: SearchTool) -> SearchTool:
+    """Wrap a tool with the shared search cache if caching is enabled."""
+    cache = get_search_cache()
+    return CachedSearchTool(tool, cache) if cache is not None else tool
@@ -2,6 +2,8 @@
 
 import asyncio
 import re
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING, cast
 
 import structlog
@@ -15,6 +17,23 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# Paper ID URL patterns, compiled once (extract_paper_id runs for every evidence item)
+_PUBMED_RE = re.compile(r"pubmed\.ncbi\.nlm\.nih\.gov/(\d+)")
+_EPMC_MED_RE = re.compile(r"europepmc\.org/article/MED/(\d+)")
+_EPMC_PMC_RE = re.compile(r"europepmc\.org/article/PMC/(PMC\d+)")
+_EPMC_PPR_RE = re.compile(r"europepmc\.org/article/PPR/(PPR\d+)")
+_EPMC_PAT_RE = re.compile(r"europepmc\.org/article/PAT/([A-Z]{2}\d+)")
+_DOI_RE = re.compile(r"doi\.org/(10\.\d+/[^\s\]>]+)")
+_OPENALEX_RE = re.compile(r"openalex\.org/(W\d+)")
+_NCT_RE = re.compile(r"clinicaltrials\.gov/study/(NCT\d+)")
+_NCT_LEGACY_RE = re.compile(r"clinicaltrials\.gov/ct2/show/(NCT\d+)")
+
+# Deduplication keeps the copy from the earliest source in this order
+_SOURCE_PRIORITY = {"pubmed": 0, "europepmc": 1, "openalex": 2, "clinicaltrials": 3}
+
+# (tool names, query, max_results_per_tool)
+_ResultCacheKey = tuple[tuple[str, ...], str, int]
+
 
 def extract_paper_id(evidence: "Evidence") -> str | None:
     """Extract unique paper identifier from Evidence.
@@ -44,48 +63,48 @@ def extract_paper_id(evidence: "Evidence") -> str | None:
     # Strategy 2: URL pattern matching
 
     # PubMed URL pattern
-    pmid_match = re.search(r"pubmed\.ncbi\.nlm\.nih\.gov/(\d+)", url)
+    pmid_match = _PUBMED_RE.search(url)
     if pmid_match:
         return f"PMID:{pmid_match.group(1)}"
 
     # Europe PMC MED pattern (same as PMID)
-    epmc_med_match = re.search(r"europepmc\.org/article/MED/(\d+)", url)
+    epmc_med_match = _EPMC_MED_RE.search(url)
     if epmc_med_match:
         return f"PMID:{epmc_med_match.group(1)}"
 
     # Europe PMC PMC pattern (PubMed Central ID - different from PMID!)
-    epmc_pmc_match = re.search(r"europepmc\.org/article/PMC/(PMC\d+)", url)
+    epmc_pmc_match = _EPMC_PMC_RE.search(url)
     if epmc_pmc_match:
         return f"PMCID:{epmc_pmc_match.group(1)}"
 
     # Europe PMC PPR pattern (Preprint ID - unique per preprint)
-    epmc_ppr_match = re.search(r"europepmc\.org/article/PPR/(PPR\d+)", url)
+    epmc_ppr_match = _EPMC_PPR_RE.search(url)
     if epmc_ppr_match:
         return f"PPRID:{epmc_ppr_match.group(1)}"
 
     # Europe PMC PAT pattern (Patent ID - e.g., WO8601415, EP1234567)
-    epmc_pat_match = re.search(r"europepmc\.org/article/PAT/([A-Z]{2}\d+)", url)
+    epmc_pat_match = _EPMC_PAT_RE.search(url)
     if epmc_pat_match:
         return f"PATID:{epmc_pat_match.group(1)}"
 
     # DOI pattern (normalize trailing slash/characters)
-    doi_match = re.search(r"doi\.org/(10\.\d+/[^\s\]>]+)", url)
+    doi_match = _DOI_RE.search(url)
     if doi_match:
         doi = doi_match.group(1).rstrip("/")
         return f"DOI:{doi}"
 
     # OpenAlex ID pattern (fallback if no PMID in metadata)
-    openalex_match = re.search(r"openalex\.org/(W\d+)", url)
+    openalex_match = _OPENALEX_RE.search(url)
     if openalex_match:
         return f"OAID:{openalex_match.group(1)}"
 
     # ClinicalTrials NCT ID (modern format)
-    nct_match = re.search(r"clinicaltrials\.gov/study/(NCT\d+)", url)
+    nct_match = _NCT_RE.search(url)
     if nct_match:
         return f"NCT:{nct_match.group(1)}"
 
     # ClinicalTrials NCT ID (legacy format)
-    nct_legacy_match = re.search(r"clinicaltrials\.gov/ct2/show/(NCT\d+)", url)
+    nct_legacy_match = _NCT_LEGACY_RE.search(url)
     if nct_legacy_match:
         return f"NCT:{nct_legacy_match.group(1)}"
 
@@ -108,9 +127,8 @@ def deduplicate_evidence(evidence_list: list["Evidence"]) -> list["Evidence"]:
     unique: list[Evidence] = []
 
     # Sort by source priority (PubMed first)
-    source_priority = {"pubmed": 0, "europepmc": 1, "openalex": 2, "clinicaltrials": 3}
     sorted_evidence = sorted(
-        evidence_list, key=lambda e: source_priority.get(e.citation.source, 99)
+        evidence_list, key=lambda e: _SOURCE_PRIORITY.get(e.citation.source, 99)
     )
 
     for evidence in sorted_evidence:
@@ -128,24 +146,56 @@ def deduplicate_evidence(evidence_list: list["Evidence"]) -> list["Evidence"]:
     return unique
 
 
+def _copy_result(result: SearchResult) -> SearchResult:
+    """Copy a shared (cached or coalesced) result so one caller can't modify it for others.
+
+    Evidence items are frozen, so copying the list is enough.
+    """
+    return result.model_copy(update={"evidence": list(result.evidence)})
+
+
+class _InflightSearch:
+    """A running fan-out shared by every concurrent caller of the same search."""
+
+    def __init__(self, task: "asyncio.Task[SearchResult]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
 class SearchHandler:
     """Orchestrates parallel searches across multiple tools."""
 
-    def __init__(self, tools: list[SearchTool], timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        tools: list[SearchTool],
+        timeout: float = 30.0,
+        cache_ttl: float | None = None,
+        cache_size: int = 256,
+    ) -> None:
         """
         Initialize the search handler.
 
         Args:
             tools: List of search tools to use
             timeout: Timeout for each search in seconds
+            cache_ttl: Seconds to reuse the result of an identical search (None disables)
+            cache_size: Max number of results kept when caching is enabled
         """
         self.tools = tools
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._result_cache: OrderedDict[_ResultCacheKey, tuple[float, SearchResult]] = OrderedDict()
+        self._inflight: dict[_ResultCacheKey, _InflightSearch] = {}
 
     async def execute(self, query: str, max_results_per_tool: int = 10) -> SearchResult:
         """
         Execute search across all tools in parallel.
 
+        Concurrent identical searches share a single fan-out. With cache_ttl
+        set, a repeat of a recent identical search is answered from memory
+        without contacting any tool.
+
         Args:
             query: The search query
             max_results_per_tool: Max results from each tool
@@ -153,6 +203,69 @@ class SearchHandler:
         Returns:
             SearchResult containing all evidence and metadata
         """
+        key = (tuple(t.name for t in self.tools), query, max_results_per_tool)
+        if self.cache_ttl is not None:
+            cached = self._get_cached(key)
+            if cached is not None:
+                logger.info("Search result cache hit", query=query)
+                return cached
+
+        result = await self._search_coalesced(key, query, max_results_per_tool)
+        # Partial results (a tool errored) and empty results are not cached: both are
+        # often transient upstream problems
+        if self.cache_ttl is not None and result.evidence and not result.errors:
+            self._result_cache[key] = (time.monotonic(), result)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+        return _copy_result(result)
+
+    async def _search_coalesced(
+        self,
+        key: _ResultCacheKey,
+        query: str,
+        max_results_per_tool: int,
+    ) -> SearchResult:
+        """Join the in-flight fan-out for key, starting one if there is none."""
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            task = asyncio.create_task(self._search_all(query, max_results_per_tool))
+            started = self._inflight[key] = _InflightSearch(task)
+            task.add_done_callback(lambda _: self._forget_inflight(key, started))
+            inflight = started
+        else:
+            logger.info("Joining in-flight search", query=query)
+
+        inflight.waiters += 1
+        try:
+            # Shielded so one cancelled caller doesn't cancel the search for the others
+            return await asyncio.shield(inflight.task)
+        finally:
+            inflight.waiters -= 1
+            if not inflight.waiters and not inflight.task.done():
+                # Every caller gave up; stop the fan-out like an unshared search would
+                inflight.task.cancel()
+                self._forget_inflight(key, inflight)
+
+    def _forget_inflight(self, key: _ResultCacheKey, inflight: _InflightSearch) -> None:
+        # A cancelled search may finish after a newer one for the same key started
+        if self._inflight.get(key) is inflight:
+            del self._inflight[key]
+
+    def _get_cached(self, key: _ResultCacheKey) -> SearchResult | None:
+        """Return a fresh cached result for key, or None on a miss."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        created_at, result = entry
+        if self.cache_ttl is None or time.monotonic() - created_at > self.cache_ttl:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return _copy_result(result)
+
+    async def _search_all(self, query: str, max_results_per_tool: int) -> SearchResult:
+        """Fan out to every tool and merge their results."""
         logger.info("Starting search", query=query, tools=[t.name for t in self.tools])
 
         # Create tasks for parallel execution
@@ -160,7 +273,8 @@ class SearchHandler:
             self._search_with_timeout(tool, query, max_results_per_tool) for tool in self.tools
         ]
 
-        # Gather results (don't fail if one tool fails)
+        # Gather results (don't fail if one tool fails). Cancelling this search
+        # cancels the gather, which cancels every tool still running.
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Process results
@@ -1,6 +1,7 @@
 """Web search tool using DuckDuckGo."""
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 import structlog
 from duckduckgo_search import DDGS
@@ -9,15 +10,39 @@ from src.utils.models import Citation, Evidence, SearchResult
 
 logger = structlog.get_logger()
 
+# DDGS calls block on the network; a small dedicated pool keeps them off the default
+# executor and caps concurrent DuckDuckGo requests (it rate-limits bursts with 429s)
+_DDGS_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ddgs")
+
 
 class WebSearchTool:
     """Tool for searching the web using DuckDuckGo."""
 
     def __init__(self) -> None:
         self._ddgs = DDGS()
+        self._inflight: dict[tuple[str, int], asyncio.Task[SearchResult]] = {}
 
     async def search(self, query: str, max_results: int = 10) -> SearchResult:
-        """Execute a web search."""
+        """Execute a web search.
+
+        Concurrent identical searches share a single DuckDuckGo request.
+        """
+        key = (query, max_results)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._search(query, max_results))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info("Joining in-flight web search", query=query)
+
+        # Shielded so one cancelled caller doesn't cancel the search for the others;
+        # the executor thread can't be interrupted anyway
+        result = await asyncio.shield(task)
+        # Evidence items are frozen, so copying the list keeps callers independent
+        return result.model_copy(update={"evidence": list(result.evidence)})
+
+    async def _search(self, query: str, max_results: int) -> SearchResult:
         try:
             loop = asyncio.get_running_loop()
 
@@ -25,11 +50,10 @@ class WebSearchTool:
                 # text() returns an iterator, need to list() it or iterate
                 return list(self._ddgs.text(query, max_results=max_results))
 
-            raw_results = await loop.run_in_executor(None, _do_search)
+            raw_results = await loop.run_in_executor(_DDGS_EXECUTOR, _do_search)
 
-            evidence = []
-            for r in raw_results:
-                ev = Evidence(
+            evidence = [
+                Evidence(
                     content=r.get("body", ""),
                     citation=Citation(
                         title=r.get("title", "No Title"),
@@ -40,7 +64,8 @@ class WebSearchTool:
                     ),
                     relevance=0.0,
                 )
-                evidence.append(ev)
+                for r in raw_results
+            ]
 
             return SearchResult(
                 query=query, evidence=evidence, sources_searched=["web"], total_found=len(evidence)
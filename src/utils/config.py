@@ -1,7 +1,12 @@
 """Application configuration using Pydantic Settings."""
 
+import atexit
+import json
 import logging
-from typing import Literal
+import queue
+from collections.abc import Callable
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Literal
 
 import structlog
 from pydantic import Field
@@ -51,6 +56,10 @@ class Settings(BaseSettings):
         default="all-MiniLM-L6-v2",
         description="Local sentence-transformers model (used by EmbeddingService)",
     )
+    local_embedding_backend: Literal["torch", "onnx", "openvino"] = Field(
+        default="torch",
+        description="Inference backend for the local model (onnx/openvino are faster on CPU)",
+    )
 
     # PubMed Configuration
     ncbi_api_key: str | None = Field(
@@ -72,6 +81,13 @@ class Settings(BaseSettings):
         description="Timeout for Advanced mode in seconds (default 10 min)",
     )
     search_timeout: int = Field(default=30, description="Seconds to wait for search")
+    search_cache_dir: str | None = Field(
+        default=None,
+        description="Directory for the persistent search result cache (disabled if unset)",
+    )
+    search_cache_ttl: int = Field(
+        default=86400, ge=0, description="Seconds before cached search results expire"
+    )
 
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
@@ -121,25 +137,68 @@ def get_settings() -> Settings:
     return Settings()
 
 
+_log_listener: QueueListener | None = None
+
+
+def _log_json_serializer() -> Callable[..., str]:
+    """Return the JSONRenderer serializer: orjson (installed with gradio) if available."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps
+
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        try:
+            return orjson.dumps(
+                obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            # orjson rejects what stdlib json accepts, e.g. ints wider than 64 bits;
+            # a log call must never raise, so render those events the slow way
+            kwargs.setdefault("default", str)
+            return json.dumps(obj, **kwargs)
+
+    return dumps
+
+
 def configure_logging(settings: Settings) -> None:
-    """Configure structured logging with the configured log level."""
-    # Set stdlib logging level from settings
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level),
-        format="%(message)s",
-    )
+    """Configure structured logging with the configured log level.
+
+    Records are handed to a QueueListener thread for writing, so logging from
+    async code only enqueues and never blocks the event loop on stream I/O.
+    """
+    global _log_listener
+
+    level = getattr(logging, settings.log_level)
+
+    if _log_listener is None:
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _log_listener = QueueListener(log_queue, logging.StreamHandler())
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+
+        # Set stdlib logging level from settings
+        logging.basicConfig(
+            level=level,
+            format="%(message)s",
+            handlers=[QueueHandler(log_queue)],
+        )
 
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.JSONRenderer(),
+            # The filtering logger passes exc_info through the event dict rather
+            # than to stdlib, so render the traceback here
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=_log_json_serializer()),
         ],
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below the level are no-op methods: no event dict, processors or I/O
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
     )
 
 
@@ -0,0 +1,8 @@
+"""Dedicated thread pools for blocking network clients."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Blocking InferenceClient calls (and each read of a response stream) run here rather
+# than in the default executor, so slow network waits don't queue up behind - or
+# starve - the CPU-bound embedding work that shares it
+HF_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="hf-inference")
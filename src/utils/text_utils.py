@@ -1,8 +1,10 @@
 """Text processing utilities for evidence handling."""
 
+import heapq
 from typing import TYPE_CHECKING
 
 import numpy as np
+import numpy.typing as npt
 
 if TYPE_CHECKING:
     from src.services.embedding_protocol import EmbeddingServiceProtocol
@@ -73,11 +75,11 @@ async def select_diverse_evidence(
 
     # Fallback: sort by relevance score if no embeddings
     if embeddings is None:
-        return sorted(
+        return heapq.nlargest(
+            n,
             evidence,
             key=lambda e: e.relevance,  # Use .relevance (from Pydantic model)
-            reverse=True,
-        )[:n]
+        )
 
     # MMR: Maximal Marginal Relevance for diverse selection
     # Score = λ * relevance - (1-λ) * max_similarity_to_selected
@@ -89,47 +91,37 @@ async def select_diverse_evidence(
     # Get all evidence embeddings
     evidence_embs = await embeddings.embed_batch([e.content for e in evidence])
 
-    # Cosine similarity helper
-    def cosine(a: list[float], b: list[float]) -> float:
-        arr_a, arr_b = np.array(a), np.array(b)
-        denominator = float(np.linalg.norm(arr_a) * np.linalg.norm(arr_b))
-        if denominator == 0:
-            return 0.0
-        return float(np.dot(arr_a, arr_b) / denominator)
+    # Normalize once so every cosine similarity is a single dot product.
+    # Zero vectors keep a norm of 1 (similarity 0), matching the scalar definition.
+    emb_matrix = np.asarray(evidence_embs, dtype=np.float64)
+    norms = np.linalg.norm(emb_matrix, axis=1, keepdims=True)
+    unit = emb_matrix / np.where(norms == 0, 1.0, norms)
+
+    query_vec = np.asarray(query_emb, dtype=np.float64)
+    query_norm = float(np.linalg.norm(query_vec))
+    query_unit = query_vec / query_norm if query_norm else query_vec
 
     # Compute relevance scores (cosine similarity to query)
     # Note: We use semantic relevance to query, not the keyword search 'relevance' score
-    relevance_scores = [cosine(query_emb, emb) for emb in evidence_embs]
+    relevance_scores = unit @ query_unit
 
-    # Greedy MMR selection
+    # Greedy MMR selection. max_sim tracks each item's max similarity to the
+    # selected set and is updated with one matrix-vector product per pick.
     selected_indices: list[int] = []
-    remaining = set(range(len(evidence)))
+    is_selected = np.zeros(len(evidence), dtype=bool)
+    max_sim: npt.NDArray[np.float64] | None = None
 
     for _ in range(n):
-        best_score = float("-inf")
-        best_idx = -1
-
-        for idx in remaining:
-            # Relevance component
-            relevance = relevance_scores[idx]
-
-            # Diversity component: max similarity to already selected
-            if selected_indices:
-                max_sim = max(
-                    cosine(evidence_embs[idx], evidence_embs[sel]) for sel in selected_indices
-                )
-            else:
-                max_sim = 0
-
-            # MMR score
-            mmr_score = lambda_param * relevance - (1 - lambda_param) * max_sim
-
-            if mmr_score > best_score:
-                best_score = mmr_score
-                best_idx = idx
-
-        if best_idx >= 0:
-            selected_indices.append(best_idx)
-            remaining.remove(best_idx)
+        diversity = max_sim if max_sim is not None else 0.0
+        mmr_scores = lambda_param * relevance_scores - (1 - lambda_param) * diversity
+        mmr_scores[is_selected] = -np.inf
+
+        # argmax returns the first maximum, i.e. the lowest index on ties
+        best_idx = int(np.argmax(mmr_scores))
+        selected_indices.append(best_idx)
+        is_selected[best_idx] = True
+
+        sims = unit @ unit[best_idx]
+        max_sim = sims if max_sim is None else np.maximum(max_sim, sims)
 
     return [evidence[i] for i in selected_indices]
@@ -3,6 +3,7 @@
 import pytest
 from pydantic_ai.models.test import TestModel
 
+from src.agents.graph.nodes import clear_node_caches
 from src.agents.graph.workflow import create_research_graph
 
 
@@ -10,6 +11,9 @@ from src.agents.graph.workflow import create_research_graph
 @pytest.mark.asyncio
 async def test_graph_execution_flow(mocker):
     """Test the graph runs from start to finish (simulated)."""
+    # Node agents are shared per model; don't reuse ones built by earlier tests
+    clear_node_caches()
+
     # Mock get_model to return TestModel for deterministic testing
     # TestModel provides schema-driven responses without hitting real APIs
     mocker.patch("src.agents.graph.nodes.get_model", return_value=TestModel())
@@ -145,6 +145,46 @@ class TestJudgeHandler:
             assert result.recommendation == "continue"
             assert "failed" in result.reasoning.lower()
 
+    @pytest.mark.asyncio
+    async def test_assess_caches_identical_prompts(self):
+        """JudgeHandler should not call the LLM again for an unchanged prompt."""
+        mock_assessment = JudgeAssessment(
+            details=AssessmentDetails(
+                mechanism_score=5,
+                mechanism_reasoning="Partial mechanism",
+                clinical_evidence_score=4,
+                clinical_reasoning="Limited trials",
+                drug_candidates=[],
+                key_findings=[],
+            ),
+            sufficient=False,
+            confidence=0.4,
+            recommendation="continue",
+            next_search_queries=["sildenafil trials"],
+            reasoning="Need more clinical data",
+        )
+        mock_result = MagicMock()
+        mock_result.output = mock_assessment
+
+        with (
+            patch("src.agent_factory.judges.get_model") as mock_get_model,
+            patch("src.agent_factory.judges.Agent") as mock_agent_class,
+        ):
+            mock_get_model.return_value = MagicMock()
+            mock_agent = AsyncMock()
+            mock_agent.run = AsyncMock(return_value=mock_result)
+            mock_agent_class.return_value = mock_agent
+
+            handler = JudgeHandler()
+            handler.agent = mock_agent
+
+            first = await handler.assess("sildenafil efficacy", [])
+            second = await handler.assess("sildenafil efficacy", [])
+            await handler.assess("tadalafil efficacy", [])
+
+            assert first == second == mock_assessment
+            assert mock_agent.run.await_count == 2
+
 
 @pytest.mark.unit
 class TestMockJudgeHandler:
@@ -58,3 +58,25 @@ def test_get_model_openai_priority(mock_settings):
 
     model = get_model()
     assert isinstance(model, OpenAIChatModel)
+
+
+def test_get_model_reuses_model_for_same_key(mock_settings):
+    """Repeated calls share one model (and its HTTP client) per configured model/key."""
+    mock_settings.has_openai_key = True
+    mock_settings.openai_api_key = "sk-test"
+    mock_settings.openai_model = "gpt-5"
+
+    assert get_model() is get_model()
+    assert get_model(api_key="sk-other") is not get_model()
+
+
+def test_get_model_does_not_cache_byok_models(mock_settings):
+    """BYOK keys are never held in the process-wide model cache."""
+    from src.agent_factory.judges import _openai_model
+
+    mock_settings.has_openai_key = False
+    mock_settings.openai_model = "gpt-5"
+    _openai_model.cache_clear()
+
+    assert get_model(api_key="sk-byok-test") is not get_model(api_key="sk-byok-test")
+    assert _openai_model.cache_info().currsize == 0
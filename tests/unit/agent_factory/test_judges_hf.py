@@ -136,3 +136,7 @@ class TestHFInferenceJudgeHandler:
         # 5. Invalid JSON
         assert handler._extract_json("Not JSON") is None
         assert handler._extract_json("{Incomplete") is None
+
+        # 6. Bare fence and unterminated fence
+        assert handler._extract_json('```\n{"a": 1}\n```') == {"a": 1}
+        assert handler._extract_json('Result:\n```json\n{"a": 1}') == {"a": 1}
@@ -84,6 +84,23 @@ async def test_run_handles_list_input(mock_handler: AsyncMock) -> None:
     mock_handler.execute.assert_awaited_once_with("test query", max_results_per_tool=5)
 
 
+@pytest.mark.asyncio
+async def test_run_skips_urls_already_in_store(mock_handler: AsyncMock) -> None:
+    """Repeated runs (and external resets of the store) dedupe by URL."""
+    store: dict = {"current": []}
+    agent = SearchAgent(mock_handler, store)
+
+    await agent.run("test query")
+    response = await agent.run("test query")
+
+    assert len(store["current"]) == 1
+    assert "Found 1 sources (0 new added" in response.messages[0].text
+
+    store["current"] = []
+    await agent.run("test query")
+    assert len(store["current"]) == 1
+
+
 @pytest.mark.asyncio
 async def test_run_uses_embeddings(mock_handler: AsyncMock) -> None:
     """Test that run uses embedding service if provided."""
@@ -0,0 +1,13 @@
+"""Fixtures for graph node tests."""
+
+import pytest
+
+from src.agents.graph.nodes import clear_node_caches
+
+
+@pytest.fixture(autouse=True)
+def _reset_node_caches():
+    """Keep agents built around one test's mocked model out of the next test."""
+    clear_node_caches()
+    yield
+    clear_node_caches()
@@ -91,3 +91,101 @@ async def test_search_node_execution(mocker):
     assert "messages" in update
     # Matches "Found 0 total, 0 unique new papers."
     assert "0 unique new papers" in update["messages"][0].content
+
+
+@pytest.mark.asyncio
+async def test_supervisor_reuses_cached_decision():
+    """Test identical state summaries are served from the decision cache."""
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    from src.agents.graph.nodes import _supervisor_cache
+
+    llm = FakeListChatModel(responses=['{"next_step": "judge", "reasoning": "Evaluate."}'])
+
+    state: ResearchState = {
+        "query": "cached query",
+        "hypotheses": [],
+        "conflicts": [],
+        "evidence_ids": ["e1"],
+        "messages": [],
+        "next_step": "search",
+        "iteration_count": 1,
+        "max_iterations": 10,
+    }
+
+    first = await supervisor_node(state, llm=llm)
+    # FakeListChatModel cycles responses; a second LLM call would still succeed,
+    # so verify through the cache counters instead.
+    second = await supervisor_node(state, llm=llm)
+
+    assert first["next_step"] == second["next_step"] == "judge"
+    assert second["iteration_count"] == 2
+    assert _supervisor_cache.hits == 1
+    assert _supervisor_cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_supervisor_skips_llm_for_empty_state(mocker):
+    """Test an empty state routes to search without calling the LLM."""
+    llm = mocker.Mock()
+
+    state: ResearchState = {
+        "query": "empty state",
+        "hypotheses": [],
+        "conflicts": [],
+        "evidence_ids": [],
+        "messages": [],
+        "next_step": "search",
+        "iteration_count": 0,
+        "max_iterations": 10,
+    }
+
+    update = await supervisor_node(state, llm=llm)
+
+    assert update == {"next_step": "search", "iteration_count": 1}
+    assert not llm.mock_calls
+
+
+@pytest.mark.asyncio
+async def test_supervisor_chain_falls_back_when_structured_output_is_none():
+    """Test a structured call that returns None falls back to the parser chain."""
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+    from langchain_core.runnables import RunnableLambda
+
+    from src.agents.graph.nodes import build_supervisor_chain
+
+    class TextOnlyChatModel(FakeListChatModel):
+        # Mirrors tool-calling models that answer in plain text: the structured
+        # wrapper yields None instead of raising.
+        def with_structured_output(self, schema, **kwargs):  # type: ignore[no-untyped-def]
+            return RunnableLambda(lambda _: None)
+
+    llm = TextOnlyChatModel(responses=['{"next_step": "judge", "reasoning": "Evaluate."}'])
+
+    decision = await build_supervisor_chain(llm).ainvoke(
+        {
+            "query": "fallback query",
+            "hypo_count": 0,
+            "conflict_count": 0,
+            "iteration": 1,
+            "max_iter": 10,
+        }
+    )
+
+    assert decision.next_step == "judge"
+    assert decision.reasoning == "Evaluate."
+
+
+def test_node_agent_is_shared_per_model(mocker):
+    """Test judge/synthesize agents are built once per model, not per call."""
+    from src.agents.graph.nodes import _get_node_agent
+    from src.utils.models import HypothesisAssessment
+
+    mocker.patch("src.agents.graph.nodes.get_model", return_value=mocker.Mock())
+    agent_class = mocker.patch("src.agents.graph.nodes.Agent")
+
+    first = _get_node_agent(HypothesisAssessment, "system prompt")
+    second = _get_node_agent(HypothesisAssessment, "system prompt")
+
+    assert first is second
+    agent_class.assert_called_once()
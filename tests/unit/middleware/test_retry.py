@@ -53,3 +53,17 @@ async def test_retry_middleware_raises_after_max_attempts():
 
     with pytest.raises(Exception, match="Always fails"):
         await middleware.process(context, always_fails)
+
+
+def test_retry_middleware_classifies_transient_errors():
+    """RetryMiddleware should retry timeouts/connection errors by class or name."""
+
+    class APIConnectionError(Exception):
+        """Stand-in for a provider SDK error outside the builtin hierarchy."""
+
+    middleware = RetryMiddleware()
+
+    assert middleware._is_retryable(TimeoutError())
+    assert middleware._is_retryable(ConnectionResetError())
+    assert middleware._is_retryable(APIConnectionError())
+    assert not middleware._is_retryable(ValueError("bad input"))
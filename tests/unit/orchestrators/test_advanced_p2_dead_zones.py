@@ -63,3 +63,29 @@ async def test_advanced_initialization_events():
         assert types[1] == "progress"
         assert types[2] == "progress"
         assert types[3] == "progress"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_advanced_closing_early_cancels_embedding_load():
+    """Closing the stream during initialization must not leave the load task pending."""
+    import asyncio
+    import threading
+
+    release = threading.Event()
+
+    with patch(
+        "src.orchestrators.advanced.AdvancedOrchestrator._init_embedding_service",
+        side_effect=lambda: release.wait(timeout=5),
+    ):
+        orch = AdvancedOrchestrator(api_key="sk-dummy")
+        stream = orch.run("test query")
+        try:
+            await anext(stream)
+            await stream.aclose()
+            await asyncio.sleep(0)
+
+            pending = asyncio.all_tasks() - {asyncio.current_task()}
+            assert not pending
+        finally:
+            release.set()
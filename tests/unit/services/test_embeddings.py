@@ -65,6 +65,17 @@ class TestEmbeddingService:
         # Ensure it ran in executor (mock encode called)
         mock_sentence_transformer.encode.assert_called_once()
 
+    def test_model_uses_configured_backend(self, mock_chroma_client):
+        """Non-torch backends are passed through to SentenceTransformer."""
+        with (
+            patch("src.services.embeddings.settings") as mock_settings,
+            patch("src.services.embeddings.SentenceTransformer") as mock_st_class,
+        ):
+            mock_settings.local_embedding_backend = "onnx"
+            EmbeddingService(model_name="test-model")
+
+        mock_st_class.assert_called_once_with("test-model", backend="onnx")
+
     @pytest.mark.asyncio
     async def test_batch_embed_efficient(self, mock_sentence_transformer, mock_chroma_client):
         """Batch embedding should call encode with list."""
@@ -0,0 +1,137 @@
+"""Unit tests for LlamaIndexRAGService collection and ingestion logic."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.llamaindex_rag import LlamaIndexRAGService
+from src.utils.exceptions import EmbeddingError
+from src.utils.models import Citation, Evidence
+
+
+@pytest.fixture
+def service() -> LlamaIndexRAGService:
+    """A service wired to mocks, skipping the LlamaIndex/ChromaDB setup in __init__."""
+    svc = LlamaIndexRAGService.__new__(LlamaIndexRAGService)
+    svc.collection_name = "test_evidence"
+    svc.chroma_client = MagicMock()
+    svc.collection = MagicMock()
+    svc.index = MagicMock()
+    svc._ChromaVectorStore = MagicMock()
+    svc._StorageContext = MagicMock()
+    svc._VectorStoreIndex = MagicMock()
+    return svc
+
+
+class TestClearCollection:
+    def test_recreates_collection_and_index(self, service: LlamaIndexRAGService) -> None:
+        new_collection = service.chroma_client.create_collection.return_value
+
+        service.clear_collection()
+
+        service.chroma_client.delete_collection.assert_called_once_with("test_evidence")
+        service.chroma_client.create_collection.assert_called_once_with("test_evidence")
+        assert service.collection is new_collection
+        service._ChromaVectorStore.assert_called_once_with(chroma_collection=new_collection)
+        assert service.index is service._VectorStoreIndex.return_value
+
+    def test_failure_raises_embedding_error(self, service: LlamaIndexRAGService) -> None:
+        service.chroma_client.delete_collection.side_effect = ValueError("boom")
+
+        with pytest.raises(EmbeddingError, match="Failed to clear collection"):
+            service.clear_collection()
+
+
+def _doc(doc_id: str) -> MagicMock:
+    doc = MagicMock()
+    doc.get_doc_id.return_value = doc_id
+    doc.hash = f"hash-{doc_id}"
+    return doc
+
+
+class TestInsertDocuments:
+    def test_all_documents_go_through_one_batch(self, service: LlamaIndexRAGService) -> None:
+        service._Settings = MagicMock()
+        nodes = [MagicMock() for _ in range(5)]
+        service._run_transformations = MagicMock(return_value=nodes)
+        docs = [_doc("a"), _doc("b"), _doc("c")]
+
+        service.ingest_documents(docs)
+
+        # One transformation pass and one insert_nodes call for the whole batch,
+        # rather than one insert (and embedding request) per document
+        service._run_transformations.assert_called_once_with(
+            docs, service._Settings.transformations
+        )
+        service.index.insert_nodes.assert_called_once_with(nodes)
+        service.index.insert.assert_not_called()
+        # Docstore hashes are still recorded per document, as index.insert() would
+        recorded = [c.args for c in service.index.docstore.set_document_hash.call_args_list]
+        assert recorded == [("a", "hash-a"), ("b", "hash-b"), ("c", "hash-c")]
+
+    def test_separate_ingests_are_separate_batches(self, service: LlamaIndexRAGService) -> None:
+        service._Settings = MagicMock()
+        service._run_transformations = MagicMock(side_effect=lambda docs, _: list(docs))
+
+        service.ingest_documents([_doc("a"), _doc("b")])
+        service.ingest_documents([_doc("c")])
+
+        batch_sizes = [len(c.args[0]) for c in service.index.insert_nodes.call_args_list]
+        assert batch_sizes == [2, 1]
+
+    def test_empty_input_inserts_nothing(self, service: LlamaIndexRAGService) -> None:
+        service._run_transformations = MagicMock()
+
+        service.ingest_documents([])
+
+        service._run_transformations.assert_not_called()
+        service.index.insert_nodes.assert_not_called()
+
+
+def _evidence(url: str) -> Evidence:
+    return Evidence(
+        content=f"Content for {url}",
+        citation=Citation(source="pubmed", title="Title", url=url, date="2024", authors=["A"]),
+    )
+
+
+class TestIngestEvidenceDedup:
+    @pytest.fixture
+    def ingesting(self, service: LlamaIndexRAGService) -> LlamaIndexRAGService:
+        def make_document(text: str, metadata: dict[str, str], doc_id: str) -> MagicMock:
+            return _doc(doc_id)
+
+        service._Document = MagicMock(side_effect=make_document)
+        service._insert_documents = MagicMock()  # type: ignore[method-assign]
+        return service
+
+    def test_skips_documents_already_in_collection(self, ingesting: LlamaIndexRAGService) -> None:
+        ingesting.collection.get.return_value = {"metadatas": [{"ref_doc_id": "https://a"}]}
+
+        ingesting.ingest_evidence([_evidence("https://a"), _evidence("https://b")])
+
+        ingesting.collection.get.assert_called_once_with(
+            where={"ref_doc_id": {"$in": ["https://a", "https://b"]}},
+            include=["metadatas"],
+        )
+        (inserted,) = ingesting._insert_documents.call_args.args
+        assert [d.get_doc_id() for d in inserted] == ["https://b"]
+
+    def test_reingesting_only_existing_ids_inserts_nothing(
+        self, ingesting: LlamaIndexRAGService
+    ) -> None:
+        ingesting.collection.get.return_value = {
+            "metadatas": [{"ref_doc_id": "https://a"}, {"ref_doc_id": "https://b"}]
+        }
+
+        ingesting.ingest_evidence([_evidence("https://a"), _evidence("https://b")])
+
+        ingesting._insert_documents.assert_not_called()
+
+    def test_new_documents_are_all_inserted(self, ingesting: LlamaIndexRAGService) -> None:
+        ingesting.collection.get.return_value = {"metadatas": []}
+
+        ingesting.ingest_evidence([_evidence("https://a"), _evidence("https://b")])
+
+        (inserted,) = ingesting._insert_documents.call_args.args
+        assert [d.get_doc_id() for d in inserted] == ["https://a", "https://b"]
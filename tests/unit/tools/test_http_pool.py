@@ -0,0 +1,37 @@
+"""Unit tests for the shared search-tool HTTP transport."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.tools.http_pool import get_shared_transport
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.asyncio
+async def test_shared_transport_survives_client_close() -> None:
+    transport = get_shared_transport()
+
+    async with httpx.AsyncClient(transport=transport):
+        pass
+
+    # Same pool for the next client on this loop, and still usable
+    assert get_shared_transport() is transport
+    async with httpx.AsyncClient(transport=transport) as client:
+        assert not client.is_closed
+
+
+def test_shared_transport_is_per_event_loop() -> None:
+    async def get_transport() -> httpx.AsyncBaseTransport:
+        return get_shared_transport()
+
+    loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+    try:
+        first, second = (loop.run_until_complete(get_transport()) for loop in loops)
+        assert first is not second
+        assert loops[0].run_until_complete(get_transport()) is first
+    finally:
+        for loop in loops:
+            loop.close()
@@ -0,0 +1,80 @@
+"""Unit tests for the persistent search result cache."""
+
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from src.tools.base import SearchTool
+from src.tools.search_cache import CachedSearchTool, SearchResultCache
+from src.utils.models import Citation, Evidence
+
+
+def _make_evidence(url: str) -> Evidence:
+    return Evidence(
+        content="Test content",
+        citation=Citation(source="pubmed", title="Test", url=url, date="2024", authors=[]),
+        metadata={"cited_by_count": 3},
+    )
+
+
+def _make_tool(results: list[Evidence]) -> SearchTool:
+    tool = create_autospec(SearchTool, instance=True)
+    tool.name = "pubmed"
+    tool.search = AsyncMock(return_value=results)
+    return tool
+
+
+class TestSearchResultCache:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = SearchResultCache(tmp_path)
+        evidence = [_make_evidence("https://pubmed.ncbi.nlm.nih.gov/1/")]
+
+        assert cache.get("pubmed", "query", 10) is None
+        cache.set("pubmed", "query", 10, evidence)
+
+        assert cache.get("pubmed", "query", 10) == evidence
+        # max_results is part of the key
+        assert cache.get("pubmed", "query", 5) is None
+
+    def test_expired_entry_is_a_miss(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache = SearchResultCache(tmp_path, ttl_seconds=60)
+        cache.set("pubmed", "query", 10, [_make_evidence("https://pubmed.ncbi.nlm.nih.gov/1/")])
+
+        now = time.time()
+        monkeypatch.setattr("src.tools.search_cache.time.time", lambda: now + 61)
+
+        assert cache.get("pubmed", "query", 10) is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = SearchResultCache(tmp_path)
+        cache.set("pubmed", "query", 10, [_make_evidence("https://pubmed.ncbi.nlm.nih.gov/1/")])
+        for path in tmp_path.glob("*.json"):
+            path.write_text("{not json", encoding="utf-8")
+
+        assert cache.get("pubmed", "query", 10) is None
+
+
+class TestCachedSearchTool:
+    @pytest.mark.asyncio
+    async def test_second_search_served_from_cache(self, tmp_path: Path) -> None:
+        evidence = [_make_evidence("https://pubmed.ncbi.nlm.nih.gov/1/")]
+        tool = _make_tool(evidence)
+        cached_tool = CachedSearchTool(tool, SearchResultCache(tmp_path))
+
+        assert await cached_tool.search("query", 10) == evidence
+        assert await cached_tool.search("query", 10) == evidence
+
+        assert cached_tool.name == "pubmed"
+        tool.search.assert_awaited_once_with("query", 10)
+
+    @pytest.mark.asyncio
+    async def test_empty_results_are_not_cached(self, tmp_path: Path) -> None:
+        tool = _make_tool([])
+        cached_tool = CachedSearchTool(tool, SearchResultCache(tmp_path))
+
+        await cached_tool.search("query", 10)
+        await cached_tool.search("query", 10)
+
+        assert tool.search.await_count == 2
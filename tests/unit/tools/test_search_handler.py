@@ -223,3 +223,70 @@ class TestSearchHandler:
         assert "pubmed" in result.sources_searched
         assert len(result.errors) == 1
         assert "clinicaltrials: API down" in result.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_execute_reuses_cached_result_for_identical_search(self):
+        """With cache_ttl set, a repeated search does not call the tools again."""
+        mock_tool = create_autospec(SearchTool, instance=True)
+        mock_tool.name = "pubmed"
+        mock_tool.search = AsyncMock(
+            return_value=[_make_evidence("pubmed", "https://pubmed.ncbi.nlm.nih.gov/12345678/")]
+        )
+
+        handler = SearchHandler(tools=[mock_tool], cache_ttl=60.0)
+        first = await handler.execute("test")
+        first.evidence.clear()  # Callers can't corrupt the cached entry
+        second = await handler.execute("test")
+        await handler.execute("other query")
+
+        assert second.total_found == 1
+        assert len(second.evidence) == 1
+        assert mock_tool.search.await_count == 2  # "test" once, "other query" once
+
+    @pytest.mark.asyncio
+    async def test_execute_coalesces_concurrent_identical_searches(self):
+        """Concurrent identical searches share one call per tool."""
+        import asyncio
+
+        async def _search(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return [_make_evidence("pubmed", "https://pubmed.ncbi.nlm.nih.gov/12345678/")]
+
+        mock_tool = create_autospec(SearchTool, instance=True)
+        mock_tool.name = "pubmed"
+        mock_tool.search = AsyncMock(side_effect=_search)
+
+        handler = SearchHandler(tools=[mock_tool])
+        results = await asyncio.gather(*(handler.execute("test") for _ in range(10)))
+
+        assert mock_tool.search.await_count == 1
+        assert all(r.total_found == 1 for r in results)
+        assert len({id(r.evidence) for r in results}) == 10  # Each caller gets its own list
+
+    @pytest.mark.asyncio
+    async def test_execute_cancellation_cancels_running_tools(self):
+        """Cancelling a search cancels its tool calls instead of leaving them running."""
+        import asyncio
+
+        tool_cancelled = asyncio.Event()
+
+        async def _slow_search(*args, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                tool_cancelled.set()
+                raise
+            return []
+
+        mock_tool = create_autospec(SearchTool, instance=True)
+        mock_tool.name = "pubmed"
+        mock_tool.search = _slow_search
+
+        handler = SearchHandler(tools=[mock_tool])
+        search = asyncio.create_task(handler.execute("test"))
+        await asyncio.sleep(0.01)
+        search.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await search
+        await asyncio.wait_for(tool_cancelled.wait(), timeout=1.0)
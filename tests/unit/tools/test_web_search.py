@@ -0,0 +1,34 @@
+"""Unit tests for the DuckDuckGo web search tool."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.tools.web_search import WebSearchTool
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_request() -> None:
+    release = threading.Event()
+
+    def _text(query: str, max_results: int) -> list[dict[str, str]]:
+        release.wait(timeout=5)
+        return [{"title": "Result", "href": "https://example.com/1", "body": "Body"}]
+
+    ddgs = MagicMock()
+    ddgs.text.side_effect = _text
+    with patch("src.tools.web_search.DDGS", return_value=ddgs):
+        tool = WebSearchTool()
+
+    searches = [asyncio.create_task(tool.search("sildenafil", 5)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*searches)
+
+    assert ddgs.text.call_count == 1
+    assert all(len(r.evidence) == 1 for r in results)
+    # Each caller gets its own evidence list
+    assert results[0].evidence is not results[1].evidence
+    assert not tool._inflight
@@ -1,12 +1,15 @@
 """Unit tests for configuration loading."""
 
+import json
+import logging
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+import structlog
 from pydantic import ValidationError
 
-from src.utils.config import Settings
+from src.utils.config import Settings, _log_json_serializer, configure_logging
 from src.utils.exceptions import ConfigurationError
 
 
@@ -52,3 +55,48 @@ class TestSettings:
             settings = Settings(_env_file=None)
             with pytest.raises(ConfigurationError, match="OPENAI_API_KEY not set"):
                 settings.get_api_key()
+
+
+class TestConfigureLogging:
+    """Tests for configure_logging."""
+
+    def test_exception_includes_traceback(self) -> None:
+        """logger.exception should render the traceback into the JSON output."""
+        records: list[logging.LogRecord] = []
+
+        class _Capture(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                records.append(record)
+
+        handler = _Capture()
+        root = logging.getLogger()
+        root.addHandler(handler)
+        try:
+            configure_logging(MagicMock(log_level="INFO"))
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                structlog.get_logger("test").exception("search failed")
+        finally:
+            root.removeHandler(handler)
+            structlog.reset_defaults()
+
+        output = records[-1].getMessage()
+        assert "Traceback (most recent call last)" in output
+        assert "ValueError: boom" in output
+
+    @pytest.mark.parametrize(
+        ("event", "expected"),
+        [
+            ({"counts": {1: "one"}}, {"counts": {"1": "one"}}),
+            ({"big": 2**70}, {"big": 2**70}),
+        ],
+    )
+    def test_serializer_handles_what_stdlib_json_accepts(
+        self, event: dict[str, object], expected: dict[str, object]
+    ) -> None:
+        """Non-str keys and ints wider than 64 bits should render, not raise."""
+        rendered = structlog.processors.JSONRenderer(serializer=_log_json_serializer())(
+            None, "info", event
+        )
+        assert json.loads(rendered) == expected